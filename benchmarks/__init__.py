@@ -0,0 +1,12 @@
+"""
+# Benchmarks
+
+Throughput benchmarks for `handsdown` on synthetic projects.
+
+## Usage
+
+```bash
+# generate a project with 500 modules and print stage timings as JSON
+python -m benchmarks --modules 500 --output benchmark.json
+```
+"""
@@ -0,0 +1,7 @@
+"""
+Main CLI entrypoint for benchmarks.
+"""
+from benchmarks.harness import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Benchmark harness that times each `handsdown` stage separately.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from benchmarks.project_generator import STYLES, ProjectGenerator, ProjectSettings
+from handsdown.generator import Generator
+from handsdown.settings import EXCLUDE_EXPRS, SOURCES_GLOB
+from handsdown.utils import get_version
+from handsdown.utils.path_finder import PathFinder
+from handsdown.utils.profiler import Profiler
+
+__all__ = ["STAGES", "run_stages", "run_benchmark", "main"]
+
+
+# Timed stages in execution order
+STAGES = (
+    "discovery",
+    "loading",
+    "parse",
+    "docstrings",
+    "links",
+    "toc",
+    "render",
+    "write",
+    "write_unchanged",
+)
+
+# Profiler stages nested in `render`
+RENDER_STAGES = ("parse", "docstrings", "links", "toc")
+
+
+@contextmanager
+def _timer(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    timings[stage] = time.perf_counter() - start
+
+
+def run_stages(project_path: Path, output_path: Path) -> Dict[str, float]:
+    """
+    Run all stages once and measure each of them.
+
+    Doc generation stages are measured by `Profiler`. `render` includes only time
+    not spent in nested `parse`, `docstrings`, `links` and `toc` stages, and
+    `write_unchanged` measures writes of the second run that does not change any doc.
+
+    Arguments:
+        project_path -- Project root path.
+        output_path -- Docs output path.
+
+    Returns:
+        A dictionary of stage durations in seconds.
+    """
+    timings: Dict[str, float] = {}
+    with _timer(timings, "discovery"):
+        path_finder = PathFinder(project_path).exclude(*EXCLUDE_EXPRS)
+        source_paths = list(path_finder.glob(SOURCES_GLOB))
+
+    profiler = Profiler(enabled=True)
+    with _timer(timings, "loading"):
+        generator = Generator(
+            input_path=project_path,
+            output_path=output_path,
+            source_paths=source_paths,
+            profiler=profiler,
+        )
+
+    profiler.pop_records()
+    generator.generate_docs()
+    stages = profiler.get_stages()
+    for stage in (*RENDER_STAGES, "write"):
+        timings[stage] = stages.get(stage, {}).get("wall", 0.0)
+    timings["render"] = stages["render"]["wall"] - sum(timings[i] for i in RENDER_STAGES)
+
+    profiler.pop_records()
+    generator.generate_docs()
+    timings["write_unchanged"] = profiler.get_stages()["write"]["wall"]
+    return timings
+
+
+def run_benchmark(settings: ProjectSettings, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Generate a synthetic project and measure stages on it.
+
+    Each stage duration is the best of `repeat` runs, every run starts from scratch.
+
+    Arguments:
+        settings -- Synthetic project shape.
+        repeat -- Number of runs.
+
+    Returns:
+        JSON-serializable benchmark result.
+    """
+    runs: List[Dict[str, float]] = []
+    with TemporaryDirectory() as temp_dir:
+        project_path = Path(temp_dir) / "project"
+        source_paths = ProjectGenerator(settings).write(project_path)
+        for index in range(repeat):
+            runs.append(run_stages(project_path, Path(temp_dir) / f"docs_{index}"))
+
+    stages = {stage: round(min(i[stage] for i in runs), 6) for stage in STAGES}
+    return dict(
+        version=get_version(),
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        project=dict(settings._asdict(), styles=list(settings.styles)),
+        files=len(source_paths),
+        repeat=repeat,
+        stages=stages,
+        total=round(sum(stages.values()), 6),
+    )
+
+
+def parse_args(args: Sequence[str]) -> argparse.Namespace:
+    """
+    Parse CLI arguments.
+
+    Arguments:
+        args -- CLI arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    defaults = ProjectSettings()
+    parser = argparse.ArgumentParser(
+        "python -m benchmarks", description="Measure handsdown stages on a synthetic project"
+    )
+    parser.add_argument("--modules", type=int, default=defaults.modules, help="Module count")
+    parser.add_argument(
+        "--modules-per-package",
+        type=int,
+        default=defaults.modules_per_package,
+        help="Module count in each subpackage",
+    )
+    parser.add_argument("--classes", type=int, default=defaults.classes, help="Classes per module")
+    parser.add_argument("--methods", type=int, default=defaults.methods, help="Methods per class")
+    parser.add_argument(
+        "--functions", type=int, default=defaults.functions, help="Functions per module"
+    )
+    parser.add_argument(
+        "--styles",
+        nargs="+",
+        choices=list(STYLES),
+        default=list(defaults.styles),
+        help="Docstring styles",
+    )
+    parser.add_argument(
+        "--links", type=int, default=defaults.links, help="Cross-module links per module"
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, best is used")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=argparse.FileType("w"),
+        default="-",
+        help="Output JSON path (default: stdout)",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """
+    Main entrypoint for CLI.
+    """
+    namespace = parse_args(sys.argv[1:] if args is None else args)
+    settings = ProjectSettings(
+        modules=namespace.modules,
+        modules_per_package=namespace.modules_per_package,
+        classes=namespace.classes,
+        methods=namespace.methods,
+        functions=namespace.functions,
+        styles=tuple(namespace.styles),
+        links=namespace.links,
+        seed=namespace.seed,
+    )
+    result = run_benchmark(settings, repeat=namespace.repeat)
+    json.dump(result, namespace.output, indent=4)
+    namespace.output.write("\n")
+    if namespace.output is not sys.stdout:
+        namespace.output.close()
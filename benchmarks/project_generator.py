@@ -0,0 +1,263 @@
+"""
+Synthetic Python project generator for benchmarks.
+
+Docstring styles are based on `examples` modules.
+"""
+import random
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Sequence
+
+__all__ = ["ProjectSettings", "ProjectGenerator", "STYLES"]
+
+
+# Docstring templates by style, `{link}` is replaced with a cross-link or a plain word
+STYLES: Dict[str, str] = {
+    "google": '''"""Summary line for {name}.
+
+Extended description with a reference to {link}.
+
+Args:
+    value (int): Description of `value`.
+    items (list, optional): Description of `items`.
+
+Returns:
+    int: Description of return value.
+
+Raises:
+    ValueError: If `value` is negative.
+"""''',
+    "pep257": '''"""
+Summary line for {name}.
+
+Extended description with a reference to {link}.
+
+Arguments:
+    value -- Description of `value`.
+    items -- Description of `items`.
+
+Returns:
+    Description of return value.
+
+Raises:
+    ValueError -- If `value` is negative.
+"""''',
+    "rst": '''"""
+Summary line for ``{name}``, check {link}.
+
+:param value: Description of value
+:param list items: Description of items
+:returns int: Description of return value
+:raises ValueError: If value is negative
+
+Code example::
+
+    result = {name}(1)
+"""''',
+    "sphinx": '''"""
+Summary line for ``{name}``, check {link}.
+
+.. code-block:: python
+
+    result = {name}(1)
+
+:param value: Description of value
+:param int items: Description of items
+:returns: Description of return value
+:rtype: int
+"""''',
+}
+
+
+class ProjectSettings(NamedTuple):
+    """
+    Synthetic project shape.
+
+    Attributes:
+        modules -- Total number of modules.
+        modules_per_package -- Number of modules in each subpackage.
+        classes -- Number of classes per module.
+        methods -- Number of methods per class.
+        functions -- Number of functions per module.
+        styles -- Docstring styles to choose from, see `STYLES`.
+        links -- Number of cross-module links per module.
+        seed -- Random seed.
+    """
+
+    modules: int = 100
+    modules_per_package: int = 20
+    classes: int = 3
+    methods: int = 3
+    functions: int = 2
+    styles: Sequence[str] = tuple(STYLES)
+    links: int = 2
+    seed: int = 0
+
+
+class ProjectGenerator:
+    """
+    Synthetic Python project generator for benchmarks.
+
+    Creates a `package_name` package with `modules_per_package` modules in each
+    subpackage. Modules import classes from each other and link to them in docstrings.
+
+    Examples::
+
+        generator = ProjectGenerator(ProjectSettings(modules=500))
+        generator.write(Path("/tmp/project"))
+
+    Arguments:
+        settings -- Project shape.
+        package_name -- Top level package name.
+    """
+
+    def __init__(self, settings: ProjectSettings, package_name: str = "synthetic") -> None:
+        for style in settings.styles:
+            if style not in STYLES:
+                raise ValueError(f"Unknown docstring style {style}, choose from {list(STYLES)}")
+
+        self.settings = settings
+        self.package_name = package_name
+        self._random = random.Random(settings.seed)
+        self._import_strings = [self._get_import_string(i) for i in range(settings.modules)]
+
+    @staticmethod
+    def _get_module_name(index: int) -> str:
+        return f"module_{index:04d}"
+
+    @staticmethod
+    def _get_class_name(module_index: int, class_index: int) -> str:
+        if class_index == 0:
+            return f"Module{module_index:04d}"
+        return f"Module{module_index:04d}Class{class_index}"
+
+    def _get_package_name(self, index: int) -> str:
+        return f"package_{index // self.settings.modules_per_package:03d}"
+
+    def _get_import_string(self, index: int) -> str:
+        package_name = self._get_package_name(index)
+        return f"{self.package_name}.{package_name}.{self._get_module_name(index)}"
+
+    def _render_docstring(self, name: str, link: str, indent: int) -> str:
+        style = self._random.choice(self.settings.styles)
+        lines = STYLES[style].format(name=name, link=link).split("\n")
+        return "\n".join(f"{' ' * indent}{i}" if i else i for i in lines)
+
+    def _get_linked_indexes(self, index: int) -> List[int]:
+        count = min(self.settings.links, self.settings.modules - 1)
+        # sample other modules without building a full index list for each module
+        indexes = self._random.sample(range(self.settings.modules - 1), count)
+        return [i + 1 if i >= index else i for i in indexes]
+
+    def render_module(self, index: int) -> str:
+        """
+        Render module source code.
+
+        Arguments:
+            index -- Module index.
+
+        Returns:
+            Python source code.
+        """
+        settings = self.settings
+        linked_indexes = self._get_linked_indexes(index)
+        links = [
+            f"`{self._import_strings[i]}.{self._get_class_name(i, 0)}`" for i in linked_indexes
+        ]
+        lines = [
+            '"""',
+            f"# Module {index}",
+            "",
+            f"Synthetic module with links to {', '.join(links) or 'nothing'}.",
+            '"""',
+            "from typing import Dict, List, Optional",
+            "",
+        ]
+        for linked_index in linked_indexes:
+            lines.append(
+                f"from {self._import_strings[linked_index]}"
+                f" import {self._get_class_name(linked_index, 0)}"
+            )
+        lines.extend(["", f"CONSTANT_{index} = {index}", "", ""])
+
+        def get_link() -> str:
+            if not links:
+                return "nothing"
+            return self._random.choice(links)
+
+        related_names = [self._get_class_name(i, 0) for i in linked_indexes] or ["int"]
+        for class_index in range(settings.classes):
+            class_name = self._get_class_name(index, class_index)
+            lines.append(f"class {class_name}:")
+            lines.append(self._render_docstring(class_name, get_link(), indent=4))
+            lines.append("")
+            lines.append("    # Class attribute")
+            lines.append(f"    attribute: Dict[str, int] = {{'key': {class_index}}}")
+            for method_index in range(settings.methods):
+                related_name = self._random.choice(related_names)
+                method_name = f"method_{method_index}"
+                lines.extend(
+                    [
+                        "",
+                        f"    def {method_name}(",
+                        f"        self, value: {related_name}, items: Optional[List[str]] = None",
+                        "    ) -> int:",
+                        self._render_docstring(f"{class_name}.{method_name}", get_link(), indent=8),
+                        "        if items is None:",
+                        "            return 0",
+                        "        return len(items)",
+                    ]
+                )
+            lines.extend(["", ""])
+
+        for function_index in range(settings.functions):
+            function_name = f"function_{function_index}"
+            lines.extend(
+                [
+                    f"def {function_name}(value: int, *args: str, **kwargs: int) -> List[int]:",
+                    self._render_docstring(function_name, get_link(), indent=4),
+                    "    return [value]",
+                    "",
+                    "",
+                ]
+            )
+
+        return "\n".join(lines).rstrip() + "\n"
+
+    def iter_files(self) -> Iterable[Path]:
+        """
+        Iterate over relative paths of all project files.
+
+        Yields:
+            A relative path.
+        """
+        yield Path(self.package_name) / "__init__.py"
+        package_names = sorted({self._get_package_name(i) for i in range(self.settings.modules)})
+        for package_name in package_names:
+            yield Path(self.package_name) / package_name / "__init__.py"
+        for index in range(self.settings.modules):
+            module_name = self._get_module_name(index)
+            yield Path(self.package_name) / self._get_package_name(index) / f"{module_name}.py"
+
+    def write(self, root_path: Path) -> List[Path]:
+        """
+        Write project to `root_path`.
+
+        Arguments:
+            root_path -- Project root path.
+
+        Returns:
+            A list of written source paths.
+        """
+        result: List[Path] = []
+        module_index = 0
+        for relative_path in self.iter_files():
+            path = root_path / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            content = f'"""\n{relative_path.parent.name} package.\n"""\n'
+            if relative_path.name != "__init__.py":
+                content = self.render_module(module_index)
+                module_index += 1
+            path.write_text(content)
+            result.append(path)
+
+        return result
@@ -11,12 +11,16 @@ from handsdown.utils.logger import get_logger
 class ModuleRecordList:
     """
     Aggregation of `ModuleRecord` objects.
+
+    Keeps a package tree index, so nested modules of any package can be
+    found without iterating over the whole project.
     """
 
     def __init__(self) -> None:
         self._logger = get_logger()
         self.data: List[ModuleRecord] = []
         self.import_string_map: Dict[ImportString, Any] = {}
+        self.descendants_map: Dict[ImportString, List[ModuleRecord]] = {}
 
     def find_module_record(self, import_string: ImportString) -> Optional[ModuleRecord]:
         """
@@ -49,6 +53,21 @@ class ModuleRecordList:
         """
         return {i.import_string.parts[0] for i in self}
 
+    def get_descendants(self, import_string: ImportString) -> List[ModuleRecord]:
+        """
+        Get `ModuleRecord` entries nested in a package.
+
+        Arguments:
+            import_string -- Package import string. If empty - all entries are returned.
+
+        Returns:
+            A list of nested `ModuleRecord` entries in order they were added.
+        """
+        if not import_string:
+            return self.data
+
+        return self.descendants_map.get(import_string, [])
+
     def add(self, module_record: ModuleRecord) -> None:
         """
         Add new `ModuleRecord`.
@@ -59,6 +78,38 @@ class ModuleRecordList:
         self.data.append(module_record)
         self.import_string_map[module_record.import_string] = module_record
 
+        import_string = module_record.import_string
+        while not import_string.is_top_level():
+            import_string = import_string.parent
+            self.descendants_map.setdefault(import_string, []).append(module_record)
+
+    def replace(self, module_record: ModuleRecord) -> ModuleRecord:
+        """
+        Replace added `ModuleRecord` with the same import string.
+
+        Arguments:
+            module_record -- A new `ModuleRecord`
+
+        Returns:
+            Replaced `ModuleRecord`.
+
+        Raises:
+            KeyError -- If there is no `ModuleRecord` with this import string.
+        """
+        import_string = module_record.import_string
+        old_module_record = self.import_string_map[import_string]
+        self.import_string_map[import_string] = module_record
+
+        module_record_lists = [self.data]
+        while not import_string.is_top_level():
+            import_string = import_string.parent
+            module_record_lists.append(self.descendants_map[import_string])
+
+        for module_records in module_record_lists:
+            module_records[module_records.index(old_module_record)] = module_record
+
+        return old_module_record
+
     def __iter__(self) -> Iterator[ModuleRecord]:
         """
         Iterate over all added `ModuleRecord` entries.
@@ -21,6 +21,8 @@ class ArgumentRecord(NodeRecord):
         prefix -- Prefix for arguemnt name, used for starargs.
     """
 
+    __slots__ = ("_default", "type_hint", "prefix")
+
     def __init__(
         self,
         node: ast.arg,
@@ -17,6 +17,8 @@ class AttributeRecord(NodeRecord):
         node -- AST node.
     """
 
+    __slots__ = ("default", "value")
+
     def __init__(self, node: ast.Assign) -> None:
         super().__init__(node)
         self.default: Optional[ExpressionRecord] = None
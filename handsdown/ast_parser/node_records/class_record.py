@@ -22,6 +22,14 @@ class ClassRecord(NodeRecord):
         node -- AST node.
     """
 
+    __slots__ = (
+        "method_records",
+        "decorator_records",
+        "argument_records",
+        "base_records",
+        "support_split",
+    )
+
     def __init__(self, node: ast.ClassDef) -> None:
         super().__init__(node)
         self.method_records: List[FunctionRecord] = []
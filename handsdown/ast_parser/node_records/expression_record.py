@@ -18,6 +18,8 @@ class ExpressionRecord(NodeRecord):
         node -- AST node.
     """
 
+    __slots__ = ("parts", "analyzer")
+
     _str_split_re = re.compile(r"[\]\[ ,]")
 
     def __init__(self, node: ast.AST) -> None:
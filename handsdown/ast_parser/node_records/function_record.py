@@ -22,6 +22,16 @@ class FunctionRecord(NodeRecord):
         node -- AST node.
     """
 
+    __slots__ = (
+        "argument_records",
+        "return_type_hint",
+        "decorator_records",
+        "support_split",
+        "is_staticmethod",
+        "is_classmethod",
+        "is_async",
+    )
+
     _single_type_re = re.compile(r".+#\s*type:\s*(.+)")
     _return_type_re = re.compile(r".*#\s*type:\s*\((.*)\)\s*->\s*(.+)")
 
@@ -103,6 +113,7 @@ class FunctionRecord(NodeRecord):
         Sets `arguemnts_record` to a new `TextRecord` for each found type annotaiton.
         Also sets `return_type_hint` to a `TextRecord` if fucntion return type found.
         """
+        self.clear_render_cache()
         start_line_number = self.line_number
         for relative_line_number, line in enumerate(lines):
             match = self._return_type_re.match(line)
@@ -117,6 +128,7 @@ class FunctionRecord(NodeRecord):
 
                     argument = self.argument_records[argument_index]
                     argument.type_hint = TextRecord(argument.node, arg_type.strip())
+                    argument.clear_render_cache()
                     argument_index += 1
                 break
             match = self._single_type_re.match(line)
@@ -135,6 +147,7 @@ class FunctionRecord(NodeRecord):
                 if argument_index >= 0:
                     argument = self.argument_records[argument_index]
                     argument.type_hint = TextRecord(argument.node, arg_type.strip())
+                    argument.clear_render_cache()
 
     def _render_parts(self, indent: int) -> List[Any]:
         parts: List[Any] = []
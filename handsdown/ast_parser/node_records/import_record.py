@@ -18,6 +18,8 @@ class ImportRecord(NodeRecord):
         alias -- AST node with import alias.
     """
 
+    __slots__ = ("source", "local_name")
+
     def __init__(self, node: ASTImport, alias: ast.alias) -> None:
         super().__init__(node)
         self.source = None
@@ -12,6 +12,7 @@ from handsdown.ast_parser.node_records.class_record import ClassRecord
 from handsdown.ast_parser.node_records.function_record import FunctionRecord
 from handsdown.ast_parser.node_records.import_record import ImportRecord
 from handsdown.ast_parser.node_records.node_record import NodeRecord
+from handsdown.ast_parser.node_records.text_record import TextRecord
 from handsdown.settings import ENCODING
 from handsdown.utils.import_string import ImportString
 from handsdown.utils.indent_trimmer import IndentTrimmer
@@ -23,10 +24,31 @@ class ModuleRecord(NodeRecord):
 
     Responsible for parsing Python source as well.
 
+    Module is loaded in two passes: `build_symbols` collects only title, `__all__`
+    and public top-level names, that is enough for ToC and links lookup, and
+    `build_children` creates child records on demand when module doc is rendered
+    or when a link to its child is resolved.
+
     Arguments:
         node -- Result of `ast.parse`.
     """
 
+    __slots__ = (
+        "all_names",
+        "class_records",
+        "function_records",
+        "import_records",
+        "source_path",
+        "source_lines",
+        "import_string_map",
+        "name_index",
+        "import_alias_index",
+        "public_method_classes",
+        "symbol_names",
+        "symbols_built",
+        "children_built",
+    )
+
     def __init__(self, node: ast.Module) -> None:
         super().__init__(node)
         self.all_names: List[str] = []
@@ -39,6 +61,12 @@ class ModuleRecord(NodeRecord):
         self.title = ""
         self.import_string = ImportString("")
         self.import_string_map: Dict[ImportString, NodeRecord] = {}
+        self.name_index: Dict[str, List[NodeRecord]] = {}
+        self.import_alias_index: Dict[str, List[ImportRecord]] = {}
+        self.public_method_classes: Dict[NodeRecord, ClassRecord] = {}
+        self.symbol_names: Set[str] = set()
+        self.symbols_built = False
+        self.children_built = False
         self.docstring = self._get_docstring()
 
     @classmethod
@@ -60,6 +88,28 @@ class ModuleRecord(NodeRecord):
             New `ModuleRecord` instance.
         """
         content = source_path.read_text(encoding=encoding)
+        return cls.create_from_content(
+            content=content, source_path=source_path, import_string=import_string
+        )
+
+    @classmethod
+    def create_from_content(
+        cls,
+        content: str,
+        source_path: Path,
+        import_string: ImportString,
+    ) -> "ModuleRecord":
+        """
+        Create new `ModuleRecord` from already read Python source.
+
+        Arguments:
+            content -- Python source code.
+            source_path -- Path to a Python source file.
+            import_string -- File absolute import string.
+
+        Returns:
+            New `ModuleRecord` instance.
+        """
         node = ast.parse(content)
         assert isinstance(node, ast.Module)
         record = cls(node)
@@ -82,6 +132,15 @@ class ModuleRecord(NodeRecord):
         if import_string == self.import_string:
             return self
 
+        if self.symbols_built and not self.children_built:
+            parts = import_string.parts
+            module_parts_count = len(self.import_string.parts)
+            if len(parts) <= module_parts_count:
+                return None
+            if parts[module_parts_count] not in self.symbol_names:
+                return None
+
+        self.build_children()
         result = self.import_string_map.get(import_string)
         if result:
             return result
@@ -110,10 +169,16 @@ class ModuleRecord(NodeRecord):
 
             yield function_record
 
+    def _add_to_name_index(self, node_record: NodeRecord) -> None:
+        self.name_index.setdefault(node_record.name, []).append(node_record)
+
     def _set_import_strings(self) -> None:
         for class_record in self.class_records:
             class_record.import_string = self.import_string + class_record.name
             self.import_string_map[class_record.import_string] = class_record
+            self._add_to_name_index(class_record)
+            for method_record in class_record.get_public_methods():
+                self.public_method_classes[method_record] = class_record
 
             for class_child_record in class_record.iter_records():
                 class_child_record.import_string = (
@@ -125,10 +190,15 @@ class ModuleRecord(NodeRecord):
         for function_record in self.function_records:
             function_record.import_string = self.import_string + function_record.name
             self.import_string_map[function_record.import_string] = function_record
+            self._add_to_name_index(function_record)
 
         for attribute_record in self.attribute_records:
             attribute_record.import_string = self.import_string + attribute_record.name
             self.import_string_map[attribute_record.import_string] = attribute_record
+            self._add_to_name_index(attribute_record)
+
+        for import_record in self.import_records:
+            self.import_alias_index.setdefault(import_record.local_name, []).append(import_record)
 
     def _render_parts(self, indent: int = 0) -> List[Any]:
         parts: List[Any] = []
@@ -148,12 +218,41 @@ class ModuleRecord(NodeRecord):
 
         return parts
 
+    def build_symbols(self) -> None:
+        """
+        Collect Module title, `__all__` names and public top-level names.
+
+        Cheap first pass that does not create child records.
+        """
+        analyzer = ModuleAnalyzer()
+        analyzer.visit(self.node)
+
+        self.all_names = analyzer.all_names
+        self.symbol_names = {i.name for i in analyzer.class_nodes}
+        self.symbol_names.update(i.name for i in analyzer.function_nodes)
+        for attribute_node in analyzer.attribute_nodes:
+            for target in attribute_node.targets:
+                if isinstance(target, ast.Name):
+                    self.symbol_names.add(target.id)
+
+        main_class_lookup_name = self.name.replace("_", "")
+        for class_name in sorted(i.name for i in analyzer.class_nodes):
+            # find real title
+            if class_name.lower() == main_class_lookup_name:
+                self.title = class_name
+
+        self.symbols_built = True
+
     def build_children(self) -> None:
         """
         Collect full information about Module child records.
 
-        Used only when doc for this ModuleRecord is building.
+        Used only when doc for this ModuleRecord is building or
+        a link to its child is resolved. Executes only once if called multiple times.
         """
+        if self.children_built:
+            return
+
         analyzer = ModuleAnalyzer()
         analyzer.visit(self.node)
 
@@ -175,16 +274,96 @@ class ModuleRecord(NodeRecord):
         self.class_records.sort(key=lambda x: x.name)
         self.function_records.sort(key=lambda x: x.name)
 
-        main_class_lookup_name = self.name.replace("_", "")
         for class_record in self.class_records:
             class_record.parse()
-            # find real title
-            if class_record.name.lower() == main_class_lookup_name:
-                self.title = class_record.name
+            # method titles are used in links from other modules,
+            # so they should be ready before any record is found
+            self._parse_method_records(class_record)
 
         self._set_import_strings()
+        self.children_built = True
+
+    def strip_bodies(self) -> None:
+        """
+        Drop function bodies from AST, they are not used to build child records.
+
+        Makes the record much smaller to store or pickle. Each function body is
+        replaced with its docstring or a `pass` statement on the first body line,
+        that is still used to find function definition lines.
+        """
+        self._strip_function_bodies(self.node)
+
+    @classmethod
+    def _strip_function_bodies(cls, node: ast.AST) -> None:
+        for child_node in ast.iter_child_nodes(node):
+            if isinstance(child_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                first_node = child_node.body[0]
+                if not ast.get_docstring(child_node, clean=False):
+                    first_node = ast.Pass(lineno=first_node.lineno, col_offset=0)
+                child_node.body = [first_node]
+                continue
+
+            if isinstance(child_node, ast.stmt):
+                cls._strip_function_bodies(child_node)
+
+    def release(self) -> None:
+        """
+        Drop AST, source lines and parsed child records to free memory.
+
+        Child records are replaced with `TextRecord` stubs that keep only import strings
+        and titles, so links to children of this module can still be resolved.
+        Released module cannot be parsed or rendered again.
+        """
+        self.import_string_map = self._get_stub_import_string_map()
+        self.node = ast.Module(body=[])
+        self.docstring = ""
+        self.source_lines = []
+        self.class_records = []
+        self.function_records = []
+        self.import_records = []
+        self.attribute_records = []
+        self.name_index = {}
+        self.import_alias_index = {}
+        self.public_method_classes = {}
+
+    def create_stub(self) -> "ModuleRecord":
+        """
+        Create a lightweight copy that keeps only data needed to link to this module.
+
+        Stub has the same import string, title, source path and child import strings
+        and titles as a released module, and is cheap to send to other processes.
+
+        Returns:
+            A new `ModuleRecord` instance that cannot be parsed or rendered.
+        """
+        stub = self.__class__(ast.Module(body=[]))
+        stub.import_string_map = self._get_stub_import_string_map()
+        stub.import_string = self.import_string
+        stub.name = self.name
+        stub.title = self.title
+        stub.source_path = self.source_path
+        stub.all_names = self.all_names
+        stub.symbol_names = self.symbol_names
+        stub.docstring = ""
+        stub.symbols_built = True
+        stub.children_built = True
+        stub.parsed = True
+        return stub
+
+    def _get_stub_import_string_map(self) -> Dict[ImportString, NodeRecord]:
+        self.build_children()
+        released_node = ast.Module(body=[])
+        import_string_map: Dict[ImportString, NodeRecord] = {}
+        for import_string, node_record in self.import_string_map.items():
+            link_record = TextRecord(released_node, node_record.title)
+            link_record.name = node_record.name
+            link_record.import_string = import_string
+            import_string_map[import_string] = link_record
+
+        return import_string_map
 
     def _parse(self) -> None:
+        self.build_children()
         for attribute_record in self.attribute_records:
             attribute_record.docstring = self._get_comment_docstring(attribute_record)
 
@@ -194,11 +373,6 @@ class ModuleRecord(NodeRecord):
                 attribute_record.docstring = self._get_comment_docstring(attribute_record)
 
             for method_record in class_record.method_records:
-                method_record.parse()
-                if method_record.is_classmethod or method_record.is_staticmethod:
-                    method_record.title = f"{class_record.name}.{method_record.name}"
-                else:
-                    method_record.title = f"{class_record.name}().{method_record.name}"
                 function_lines = self._get_function_def_lines(method_record)
                 method_record.parse_type_comments(function_lines)
 
@@ -207,6 +381,15 @@ class ModuleRecord(NodeRecord):
             function_lines = self._get_function_def_lines(function_record)
             function_record.parse_type_comments(function_lines)
 
+    @staticmethod
+    def _parse_method_records(class_record: ClassRecord) -> None:
+        for method_record in class_record.method_records:
+            method_record.parse()
+            if method_record.is_classmethod or method_record.is_staticmethod:
+                method_record.title = f"{class_record.name}.{method_record.name}"
+            else:
+                method_record.title = f"{class_record.name}().{method_record.name}"
+
     def _get_function_def_lines(self, function_record: FunctionRecord) -> List[str]:
         """
         Get all function definition lines for comment type hints lookup.
@@ -262,10 +445,24 @@ class ModuleRecord(NodeRecord):
         result.reverse()
         return "\n  ".join(result)
 
+    def _iter_import_matches(self, name: str) -> Iterator[ImportString]:
+        """
+        Match `name` against imports with the same local name or a local name of its parent.
+        """
+        parts = name.split(".")
+        for index in range(len(parts)):
+            local_name = ".".join(parts[: index + 1])
+            for import_record in self.import_alias_index.get(local_name, []):
+                match = import_record.match(name)
+                if match:
+                    yield match
+
     def get_related_import_strings(self, node_record: NodeRecord) -> Set[ImportString]:
         """
         Get a set of `related_names` found in module class, function, method and attribute records.
 
+        Uses indexes built in `build_children`, so each name lookup takes constant time.
+
         Returns:
             A set of absolute import strings found.
         """
@@ -273,21 +470,15 @@ class ModuleRecord(NodeRecord):
         related_names = node_record.related_names
         if not related_names:
             return result
+
+        # method does not refer to its own class
+        method_class_record = self.public_method_classes.get(node_record)
         for related_name in related_names:
-            for class_record in self.class_records:
-                if node_record in class_record.get_public_methods():
+            for related_record in self.name_index.get(related_name, []):
+                if related_record is method_class_record:
                     continue
-                if class_record.name == related_name:
-                    result.add(class_record.import_string)
-            for function_record in self.function_records:
-                if function_record.name == related_name:
-                    result.add(function_record.import_string)
-            for import_record in self.import_records:
-                match = import_record.match(related_name)
-                if match:
-                    result.add(match)
-            for attribute_record in self.attribute_records:
-                if attribute_record.name == related_name:
-                    result.add(attribute_record.import_string)
+                result.add(related_record.import_string)
+
+            result.update(self._iter_import_matches(related_name))
 
         return result
@@ -2,12 +2,12 @@
 Base class for all node records.
 """
 from abc import abstractmethod
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import handsdown.ast_parser.smart_ast as ast
 from handsdown.ast_parser.enums import RenderPart
 from handsdown.ast_parser.type_defs import RenderExpr
-from handsdown.utils.docstring_formatter import DocstringFormatter
+from handsdown.utils.docstring_formatter import format_docstring
 from handsdown.utils.import_string import ImportString
 
 
@@ -16,6 +16,19 @@ class NodeRecord:
     Base class for all node records.
     """
 
+    __slots__ = (
+        "docstring",
+        "import_string",
+        "node",
+        "name",
+        "title",
+        "is_method",
+        "attribute_records",
+        "parsed",
+        "_line_number",
+        "_render_cache",
+    )
+
     # Max length for a multi-line render result
     LINE_LENGTH = 79
 
@@ -41,6 +54,7 @@ class NodeRecord:
         self.attribute_records: List["NodeRecord"] = []
         self.parsed = False
         self._line_number: Optional[int] = None
+        self._render_cache: Optional[Dict[Tuple[int, bool], str]] = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.name}>"
@@ -69,7 +83,7 @@ class NodeRecord:
         if isinstance(docstring, bytes):
             docstring = docstring.decode("utf-8")
 
-        return DocstringFormatter(docstring).render()
+        return format_docstring(docstring)
 
     @property
     def related_names(self) -> Set[str]:
@@ -167,6 +181,24 @@ class NodeRecord:
         Returns:
             A string representation of `node`.
         """
+        key = (indent, allow_multiline)
+        if self._render_cache is None:
+            self._render_cache = {}
+
+        result = self._render_cache.get(key)
+        if result is None:
+            result = self._render(indent, allow_multiline)
+            self._render_cache[key] = result
+
+        return result
+
+    def clear_render_cache(self) -> None:
+        """
+        Drop memoized `render` results, should be called after record is changed.
+        """
+        self._render_cache = None
+
+    def _render(self, indent: int, allow_multiline: bool) -> str:
         if not self.parsed:
             self.parse()
 
@@ -18,6 +18,8 @@ class TextRecord(ExpressionRecord):
         text -- Text to represent it.
     """
 
+    __slots__ = ()
+
     _str_split_re = re.compile(r"[\]\[ ,]")
 
     def __init__(self, node: ast.AST, text: str) -> None:
@@ -67,6 +67,7 @@ if os.environ.get("PYTHON_VER", "3") == "3":
             NotIn,
             Num,
             Or,
+            Pass,
             Pow,
             RShift,
             Set,
@@ -88,6 +89,7 @@ if os.environ.get("PYTHON_VER", "3") == "3":
             comprehension,
             expr,
             get_docstring,
+            iter_child_nodes,
             keyword,
             parse,
             stmt,
@@ -150,6 +152,7 @@ if os.environ.get("PYTHON_VER", "3") == "3":
             NotIn,
             Num,
             Or,
+            Pass,
             Pow,
             RShift,
             Set,
@@ -171,6 +174,7 @@ if os.environ.get("PYTHON_VER", "3") == "3":
             comprehension,
             expr,
             get_docstring,
+            iter_child_nodes,
             keyword,
             parse,
             stmt,
@@ -226,6 +230,7 @@ else:
         NotIn,
         Num,
         Or,
+        Pass,
         Pow,
         RShift,
         Set,
@@ -244,6 +249,7 @@ else:
         comprehension,
         expr,
         get_docstring,
+        iter_child_nodes,
         keyword,
         parse,
         stmt,
@@ -296,6 +302,7 @@ __all__ = [
     "Gt",
     "GtE",
     "IfExp",
+    "iter_child_nodes",
     "Import",
     "ImportFrom",
     "In",
@@ -322,6 +329,7 @@ __all__ = [
     "NotIn",
     "Num",
     "Or",
+    "Pass",
     "parse",
     "Pow",
     "RShift",
@@ -5,12 +5,11 @@ import argparse
 import logging
 import re
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 from urllib.parse import urlparse, urlunparse
 
-import pkg_resources
-
-from handsdown.settings import ENCODING
+from handsdown.settings import CACHE_PATH_NAME, ENCODING
+from handsdown.utils import get_version
 
 
 class CLINamespace:
@@ -34,6 +33,14 @@ class CLINamespace:
         files: Iterable[Path],
         cleanup: bool,
         encoding: str,
+        jobs: int,
+        no_cache: bool,
+        incremental: bool,
+        watch: bool,
+        profile: Optional[Path],
+        stream: bool,
+        low_memory: bool,
+        lock_style: int,
     ) -> None:
         self.panic = panic
         self.input_path = input_path
@@ -49,6 +56,14 @@ class CLINamespace:
         self.files: List[Path] = list(files)
         self.cleanup = cleanup
         self.encoding = encoding
+        self.jobs = jobs
+        self.no_cache = no_cache
+        self.incremental = incremental
+        self.watch = watch
+        self.profile = profile
+        self.stream = stream
+        self.low_memory = low_memory
+        self.lock_style = lock_style
 
     def get_source_code_url(self) -> str:
         """
@@ -152,6 +167,28 @@ def existing_dir_abs_path(path_str: str) -> Path:
     return path
 
 
+def positive_int(value_str: str) -> int:
+    """
+    Validate `value_str` to be a positive integer.
+
+    Arguments:
+        value_str -- A value to check.
+
+    Returns:
+        A positive integer.
+
+    Raises:
+        argparse.ArgumentTypeError -- If value is not a positive integer.
+    """
+    try:
+        value = int(value_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Value {value_str} is not an integer") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"Value {value_str} is not a positive integer")
+    return value
+
+
 def parse_args(args: Iterable[str]) -> CLINamespace:
     """
     Get CLI arguments parser.
@@ -159,11 +196,7 @@ def parse_args(args: Iterable[str]) -> CLINamespace:
     Returns:
         An `argparse.ArgumentParser` instance.
     """
-    try:
-        version = pkg_resources.get_distribution("handsdown").version
-    except pkg_resources.DistributionNotFound:
-        version = "0.0.0"
-
+    version = get_version()
     parser = argparse.ArgumentParser(
         "handsdown", description="Docstring-based python documentation generator."
     )
@@ -238,11 +271,66 @@ def parse_args(args: Iterable[str]) -> CLINamespace:
         help=f"Input and output file encoding (default: {ENCODING})",
         default=ENCODING,
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of worker processes to render docs with (default: 1)",
+        default=1,
+        type=positive_int,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not use loaded modules cache in {CACHE_PATH_NAME} directory",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Render only docs with changed sources or dependencies since the previous run",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Watch source files and regenerate affected docs on changes",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write module docs section by section to keep memory usage flat for huge modules",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Release module AST and source after its doc is written, cannot be used with --watch",
+    )
+    parser.add_argument(
+        "--lock-style",
+        type=positive_int,
+        default=0,
+        metavar="COUNT",
+        help="Use the same docstring style after COUNT docstrings in a row are detected as this"
+        " style. Docstrings with markers of the other style unlock detection, docstrings without"
+        " markers are parsed with the locked style, cannot be used with --jobs",
+    )
+    parser.add_argument(
+        "--profile",
+        type=abs_path,
+        default=None,
+        metavar="PATH",
+        help="Write wall and CPU time per stage and per module to a JSON file",
+    )
     parser.add_argument("--panic", action="store_true", help="Panic and die on import error")
     parser.add_argument("-d", "--debug", action="store_true", help="Show debug messages")
     parser.add_argument("-q", "--quiet", action="store_true", help="Hide log output")
     parser.add_argument("-V", "--version", action="version", version=version)
     namespace = parser.parse_args(list(args))
+    if namespace.watch and namespace.low_memory:
+        parser.error("--low-memory cannot be used with --watch")
+    if namespace.incremental and namespace.no_cache:
+        parser.error("--incremental cannot be used with --no-cache")
+    if namespace.lock_style and namespace.jobs > 1:
+        parser.error("--lock-style cannot be used with --jobs")
 
     log_level = logging.INFO
     if namespace.debug:
@@ -265,4 +353,12 @@ def parse_args(args: Iterable[str]) -> CLINamespace:
         files=namespace.files,
         cleanup=namespace.cleanup,
         encoding=namespace.encoding,
+        jobs=namespace.jobs,
+        no_cache=namespace.no_cache,
+        incremental=namespace.incremental,
+        watch=namespace.watch,
+        profile=namespace.profile,
+        stream=namespace.stream,
+        low_memory=namespace.low_memory,
+        lock_style=namespace.lock_style,
     )
@@ -0,0 +1,175 @@
+"""
+Persistent graph of module doc dependencies for incremental builds.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+from handsdown.utils.logger import get_logger
+
+__all__ = ["DependencyGraph", "DocDependencies"]
+
+
+class DocDependencies(NamedTuple):
+    """
+    Import strings of modules that were used to render a module doc.
+
+    Attributes:
+        links -- Modules that were looked up to render links.
+        tree -- Modules that were used in ToC and breadcrumbs.
+    """
+
+    links: List[str]
+    tree: List[str]
+
+
+class DependencyGraph:
+    """
+    Persistent graph of module doc dependencies for incremental builds.
+
+    For each module doc it stores a fingerprint of the module itself, fingerprints
+    of modules it links to and tree fingerprints of modules in its ToC and breadcrumbs.
+    Module doc is outdated if any of them has changed since it was rendered.
+
+    Examples::
+
+        graph = DependencyGraph(Path(".handsdown_cache/dependency_graph.json"))
+        graph.load(settings_key="...")
+        graph.is_outdated("my_module", fingerprints, tree_fingerprints)
+        True
+
+        graph.add("my_module", DocDependencies(["other"], []), fingerprints, tree_fingerprints)
+        graph.is_outdated("my_module", fingerprints, tree_fingerprints)
+        False
+        graph.save()
+
+    Arguments:
+        path -- Path to a JSON file to store the graph, graph is kept only in memory if not set.
+    """
+
+    # Graph file format version
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self._logger = get_logger()
+        self.path = path
+        self.settings_key = ""
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, settings_key: str) -> None:
+        """
+        Load graph from `path`.
+
+        Graph is reset if it is missing, broken or was built with different `settings_key`.
+        In-memory graph is reset only if `settings_key` has changed.
+
+        Arguments:
+            settings_key -- Hash of settings that affect every module doc.
+        """
+        if self.path is None:
+            if self.settings_key != settings_key:
+                self.nodes = {}
+            self.settings_key = settings_key
+            return
+
+        self.settings_key = settings_key
+        self.nodes = {}
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != self.VERSION or data.get("settings") != settings_key:
+            self._logger.debug("Build settings changed, dependency graph is reset")
+            return
+
+        nodes = data.get("nodes")
+        if isinstance(nodes, dict):
+            self.nodes = nodes
+
+    def save(self) -> None:
+        """
+        Save graph to `path`.
+        """
+        if self.path is None:
+            return
+
+        data = dict(version=self.VERSION, settings=self.settings_key, nodes=self.nodes)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, sort_keys=True))
+        except OSError as e:
+            self._logger.warning(f"Cannot save dependency graph to {self.path.as_posix()}: {e}")
+
+    @staticmethod
+    def _is_changed(saved: Mapping[str, str], current: Mapping[str, str]) -> bool:
+        for name, fingerprint in saved.items():
+            if current.get(name) != fingerprint:
+                return True
+
+        return False
+
+    def is_outdated(
+        self,
+        name: str,
+        fingerprints: Mapping[str, str],
+        tree_fingerprints: Mapping[str, str],
+    ) -> bool:
+        """
+        Check if module doc has to be rendered again.
+
+        Arguments:
+            name -- Module import string.
+            fingerprints -- Current fingerprints of all modules.
+            tree_fingerprints -- Current tree fingerprints of all modules.
+
+        Returns:
+            True if doc was never rendered or any of its dependencies changed.
+        """
+        node = self.nodes.get(name)
+        if not node:
+            return True
+
+        if node.get("source") != fingerprints.get(name):
+            return True
+
+        if self._is_changed(node.get("links", {}), fingerprints):
+            return True
+
+        if self._is_changed(node.get("tree", {}), tree_fingerprints):
+            return True
+
+        return False
+
+    def add(
+        self,
+        name: str,
+        dependencies: DocDependencies,
+        fingerprints: Mapping[str, str],
+        tree_fingerprints: Mapping[str, str],
+    ) -> None:
+        """
+        Add or replace module doc dependencies.
+
+        Arguments:
+            name -- Module import string.
+            dependencies -- Modules used to render the doc.
+            fingerprints -- Current fingerprints of all modules.
+            tree_fingerprints -- Current tree fingerprints of all modules.
+        """
+        self.nodes[name] = dict(
+            source=fingerprints[name],
+            links={i: fingerprints[i] for i in sorted(dependencies.links) if i != name},
+            tree={i: tree_fingerprints[i] for i in sorted(dependencies.tree) if i != name},
+        )
+
+    def remove(self, name: str) -> None:
+        """
+        Remove module doc from the graph, so it is outdated on the next check.
+
+        Arguments:
+            name -- Module import string.
+        """
+        self.nodes.pop(name, None)
@@ -1,23 +1,41 @@
 """
 Main handsdown documentation generator.
 """
+import copy
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
 
 from handsdown.ast_parser.module_record_list import ModuleRecordList
 from handsdown.ast_parser.node_records.attribute_record import AttributeRecord
 from handsdown.ast_parser.node_records.module_record import ModuleRecord
 from handsdown.ast_parser.node_records.node_record import NodeRecord
+from handsdown.dependency_graph import DependencyGraph, DocDependencies
 from handsdown.loader import Loader, LoaderError
 from handsdown.md_document import MDDocument
+from handsdown.md_stream_document import MDStreamDocument
 from handsdown.processors.base import BaseDocstringProcessor
+from handsdown.processors.section_map import SectionMapTuple
+from handsdown.processors.section_map_cache import SectionMapCache, SectionMapCacheKey
 from handsdown.processors.smart import SmartDocstringProcessor
 from handsdown.settings import ENCODING, FIND_IN_SOURCE_LABEL
-from handsdown.utils import make_title
+from handsdown.utils import get_hash, get_version, make_title
+from handsdown.utils.file_cache import FileCache
 from handsdown.utils.import_string import ImportString
 from handsdown.utils.logger import get_logger
 from handsdown.utils.path_finder import PathFinder
+from handsdown.utils.profiler import Profiler, ProfileRecord
 
 
 class GeneratorError(Exception):
@@ -26,6 +44,56 @@ class GeneratorError(Exception):
     """
 
 
+# Process-local `Generator` snapshot used by workers
+_worker_generator: Optional["Generator"] = None
+
+
+def _init_worker(generator: "Generator", log_level: int) -> None:
+    """
+    Set process-local `Generator` snapshot for a worker.
+
+    Arguments:
+        generator -- Generator snapshot from `Generator.create_worker_snapshot`.
+        log_level -- Logging level of the main process.
+    """
+    global _worker_generator  # pylint: disable=global-statement
+    get_logger(level=log_level)
+    _worker_generator = generator
+
+
+def _get_worker_generator() -> "Generator":
+    if _worker_generator is None:
+        raise GeneratorError("Worker is not initialized")
+
+    return _worker_generator
+
+
+def _write_doc_in_worker(
+    module_record: ModuleRecord,
+) -> Tuple[
+    bool, Optional[DocDependencies], List[ProfileRecord], Dict[SectionMapCacheKey, SectionMapTuple]
+]:
+    """
+    Render and write a doc for a `ModuleRecord` in a `generate_docs` worker.
+
+    Arguments:
+        module_record -- Loaded `ModuleRecord` to render.
+
+    Returns:
+        A tuple of a flag if doc file was written, modules used to render the doc
+        or None if module cannot be parsed, profiler records measured in the worker
+        and docstrings parsed in the worker.
+    """
+    generator = _get_worker_generator()
+    is_written, dependencies = generator.write_doc(module_record)
+    return (
+        is_written,
+        dependencies,
+        generator.profiler.pop_records(),
+        generator.section_map_cache.pop_new_entries(),
+    )
+
+
 class Generator:
     """
     Main documentation generator.
@@ -43,6 +111,13 @@ class Generator:
         source_code_path -- Path to local source code
         toc_depth -- Maximum depth of child modules ToC
         encoding -- File encoding
+        jobs -- Number of worker processes to render docs with
+        cache_path -- Path to a directory to cache loaded modules and docs dependency graph,
+            cache is disabled if not set
+        incremental -- Render only docs with changed sources or dependencies, requires `cache_path`
+        profiler -- Profiler to measure generation stages.
+        stream -- Keep module doc sections in temporary files instead of memory.
+        low_memory -- Release module AST and child records after its doc is written.
     """
 
     # Name of logger
@@ -75,8 +150,18 @@ class Generator:
         source_code_path: Optional[Path] = None,
         toc_depth: int = 1,
         encoding: str = ENCODING,
+        jobs: int = 1,
+        cache_path: Optional[Path] = None,
+        incremental: bool = False,
+        profiler: Optional[Profiler] = None,
+        stream: bool = False,
+        low_memory: bool = False,
     ) -> None:
+        if incremental and not cache_path:
+            raise GeneratorError("Incremental mode requires cache to be enabled")
+
         self._logger = get_logger()
+        self.profiler = profiler or Profiler()
         self._root_path = input_path
         self._output_path = output_path
         self._project_name = project_name or make_title(input_path.name)
@@ -86,29 +171,54 @@ class Generator:
         self._toc_depth = toc_depth
         self._raise_errors = raise_errors
         self._encoding = encoding
+        self._jobs = jobs
+        self._incremental = incremental
+        self._md_document_class = MDStreamDocument if stream else MDDocument
+        self._low_memory = low_memory
+        self._link_dependencies: Set[str] = set()
+        self._link_cache: Dict[
+            Tuple[str, str, str, bool], Optional[Tuple[NodeRecord, Optional[ModuleRecord]]]
+        ] = {}
+        self._tree_dependencies: Set[str] = set()
 
         # create output folder if it does not exist
         if not self._output_path.exists():
             self._logger.info(f"Creating folder {self._output_path.as_posix()}")
             PathFinder(self._output_path).mkdir()
 
+        self._module_cache: Optional[FileCache] = None
+        self._dependency_graph = DependencyGraph(None)
+        self.section_map_cache = SectionMapCache()
+        if cache_path:
+            self._module_cache = FileCache(cache_path / "modules")
+            self._dependency_graph = DependencyGraph(cache_path / "dependency_graph.json")
+            self.section_map_cache = SectionMapCache(cache_path / "section_maps.json")
+            self.section_map_cache.load()
+
         self._loader = loader or Loader(
             root_path=self._root_path,
             output_path=self._output_path,
             encoding=self._encoding,
+            cache=self._module_cache,
         )
         self._docstring_processor = docstring_processor or SmartDocstringProcessor()
+        self._docstring_processor.set_section_map_cache(self.section_map_cache)
 
         self._source_paths = sorted(source_paths)
         self._error_output_paths: Set[Path] = set()
         self._logger.debug(f"Generating source map for {len(self._source_paths)} source files")
         self._module_records = self._build_module_record_list()
         self._logger.debug("Source map generated")
+        if self._module_cache:
+            self._module_cache.cleanup()
+
+        self._docstring_links_re = self._compile_docstring_links_re()
+        self._prepare_index()
 
+    def _compile_docstring_links_re(self) -> Pattern[str]:
         package_names = self._module_records.get_package_names()
         package_names_re_expr = "|".join(package_names)
-        self._docstring_links_re = re.compile(rf"`+(?:{package_names_re_expr})\.\S+`+")
-        self._prepare_index()
+        return re.compile(rf"`+(?:{package_names_re_expr})\.\S+`+")
 
     def _prepare_index(self) -> None:
         self.md_index = MDDocument(self._output_path / self.INDEX_NAME, encoding=self._encoding)
@@ -130,25 +240,86 @@ class Generator:
         if not self.md_modules.title:
             self.md_modules.title = f"{self._project_name} {self.MODULES_TITLE}"
 
+    def get_module_record(self, source_path: Path) -> Optional[ModuleRecord]:
+        """
+        Load `ModuleRecord` for a `source_path`.
+
+        Arguments:
+            source_path -- Absolute path to source file.
+
+        Returns:
+            A new `ModuleRecord` instance or None if there is nothing to import.
+
+        Raises:
+            LoaderError -- If python source cannot be loaded.
+        """
+        if not self.profiler.enabled:
+            return self._loader.get_module_record(source_path)
+
+        with self.profiler.stage("load", self._loader.get_import_string(source_path)):
+            return self._loader.get_module_record(source_path)
+
+    def _load_module_record(self, source_path: Path) -> Optional[ModuleRecord]:
+        try:
+            module_record = self.get_module_record(source_path)
+        except LoaderError as e:
+            if self._raise_errors:
+                raise
+
+            self._logger.warning(f"Skipping: {e}")
+            return None
+
+        if module_record and not module_record.title:
+            module_record.title = make_title(module_record.name)
+        return module_record
+
     def _build_module_record_list(self) -> ModuleRecordList:
         module_record_list = ModuleRecordList()
         for source_path in self._source_paths:
-            module_record = None
-            try:
-                module_record = self._loader.get_module_record(source_path)
-            except LoaderError as e:
-                if self._raise_errors:
-                    raise
-
-                self._logger.warning(f"Skipping: {e}")
-                continue
+            module_record = self._load_module_record(source_path)
             if module_record:
-                if not module_record.title:
-                    module_record.title = make_title(module_record.name)
                 module_record_list.add(module_record)
 
         return module_record_list
 
+    def update(self, source_paths: Iterable[Path], changed_paths: Iterable[Path]) -> None:
+        """
+        Reload changed source files and regenerate affected docs.
+
+        Modules of unchanged source files are reused. Docs are rendered only for
+        changed modules and modules that depend on them. Index and modules docs are
+        regenerated as well.
+
+        Arguments:
+            source_paths -- All current source paths.
+            changed_paths -- New or modified source paths.
+
+        Raises:
+            GeneratorError -- If `low_memory` is set, released modules cannot be rendered again.
+        """
+        if self._low_memory:
+            raise GeneratorError("Docs cannot be updated in low memory mode")
+
+        loaded_paths = set(self._source_paths)
+        changed_path_set = set(changed_paths)
+        module_records = {i.source_path: i for i in self._module_records}
+
+        self._source_paths = sorted(source_paths)
+        module_record_list = ModuleRecordList()
+        for source_path in self._source_paths:
+            module_record = module_records.get(source_path)
+            if source_path in changed_path_set or source_path not in loaded_paths:
+                module_record = self._load_module_record(source_path)
+            if module_record:
+                module_record_list.add(module_record)
+
+        self._module_records = module_record_list
+        self._docstring_links_re = self._compile_docstring_links_re()
+        self._prepare_index()
+        self._generate_docs(incremental=True)
+        self.generate_index()
+        self.generate_modules()
+
     def cleanup_old_docs(self) -> None:
         """
         Remove old docs generated for this module.
@@ -199,12 +370,7 @@ class Generator:
             if module_record.source_path != source_path:
                 continue
 
-            output_path = self._loader.get_output_path(module_record.source_path)
-
-            md_document = MDDocument(output_path, encoding=self._encoding)
-            self._generate_doc(module_record, md_document)
-            md_document.write()
-
+            self._write_doc(module_record)
             return
 
         raise GeneratorError(f"Record not found for {source_path.name}")
@@ -222,12 +388,14 @@ class Generator:
         source_path_str = self._root_path_finder.relative(md_document.path)
         self._logger.debug(f"Generating doc {md_document_path_str} for {source_path_str}")
         try:
-            self._loader.parse_module_record(module_record)
+            with self.profiler.stage("parse", module_record.import_string.value):
+                self._loader.parse_module_record(module_record)
         except LoaderError as e:
             if self._raise_errors:
                 raise
 
             self._logger.warning(f"Skipping: {e}")
+            self._error_output_paths.add(md_document.path)
             return
 
         source_link = md_document.render_link(
@@ -248,19 +416,21 @@ class Generator:
             md_document.subtitle = autogenerated_marker
 
         self._generate_module_doc_lines(module_record, md_document)
-        md_document.add_toc_if_not_exists()
+        with self.profiler.stage("toc", module_record.import_string.value):
+            md_document.add_toc_if_not_exists()
 
-        modules_toc_lines = self._build_modules_toc_lines(
-            module_record.import_string,
-            max_depth=self._toc_depth,
-            md_document=md_document,
-            start_level=2,
-        )
+            modules_toc_lines = self._build_modules_toc_lines(
+                module_record.import_string,
+                max_depth=self._toc_depth,
+                md_document=md_document,
+                start_level=2,
+            )
+
+            breadscrumbs = self._build_breadcrumbs_string(
+                module_record=module_record, md_document=md_document
+            )
 
         toc_lines = md_document.toc_section.split("\n")
-        breadscrumbs = self._build_breadcrumbs_string(
-            module_record=module_record, md_document=md_document
-        )
         toc_lines[0] = md_document.get_toc_line(breadscrumbs, level=0)
         if modules_toc_lines:
             toc_line = md_document.get_toc_line(self.MODULES_TITLE, level=1)
@@ -290,6 +460,8 @@ class Generator:
                 import_string_breadcrumbs.append(f"`{make_title(parent_import_string.parts[-1])}`")
                 continue
 
+            self._tree_dependencies.add(parent_module_record.import_string.value)
+
             output_path = self._loader.get_output_path(parent_module_record.source_path)
             import_string_breadcrumbs.append(
                 md_document.render_doc_link(
@@ -310,18 +482,217 @@ class Generator:
 
         return " / ".join(breadcrumbs)
 
+    def _find_module_record(self, import_string: ImportString) -> Optional[ModuleRecord]:
+        """
+        Find `ModuleRecord` by import string and add it to current doc link dependencies.
+        """
+        module_record = self._module_records.find_module_record(import_string)
+        if module_record:
+            self._link_dependencies.add(module_record.import_string.value)
+        return module_record
+
+    def create_worker_snapshot(self) -> "Generator":
+        """
+        Create a lightweight copy of the generator to send to render workers.
+
+        Module records are replaced with stubs that keep only data used for links,
+        ToC and breadcrumbs, a full record is sent with each render task.
+        Profiler records, dependency graph and cached docstrings are not copied.
+
+        Returns:
+            A new `Generator` instance that can render only records passed to `write_doc`.
+        """
+        snapshot = copy.copy(self)
+        snapshot._module_records = ModuleRecordList()
+        for module_record in self._module_records:
+            snapshot._module_records.add(module_record.create_stub())
+        snapshot._source_paths = []
+        snapshot._link_cache = {}
+        snapshot._dependency_graph = DependencyGraph(None)
+        snapshot.profiler = Profiler(enabled=self.profiler.enabled)
+        return snapshot
+
+    def write_doc(self, module_record: ModuleRecord) -> Tuple[bool, Optional[DocDependencies]]:
+        """
+        Render and write a doc for a `ModuleRecord` loaded in another process.
+
+        Record replaces its stub from `create_worker_snapshot` while the doc is rendered.
+
+        Arguments:
+            module_record -- Loaded `ModuleRecord` to render.
+
+        Returns:
+            A tuple of a flag if doc file was written and modules used to render the doc
+            or None if module cannot be parsed.
+        """
+        stub = self._module_records.replace(module_record)
+        try:
+            return self._write_doc(module_record)
+        finally:
+            self._module_records.replace(stub)
+
+    def _write_doc(self, module_record: ModuleRecord) -> Tuple[bool, Optional[DocDependencies]]:
+        output_path = self._loader.get_output_path(module_record.source_path)
+        md_document = self._md_document_class(output_path, encoding=self._encoding)
+        self._link_dependencies = set()
+        self._tree_dependencies = set()
+        self._link_cache.clear()
+        self._error_output_paths.discard(output_path)
+        module_name = module_record.import_string.value
+        try:
+            with self.profiler.stage("render", module_name):
+                self._generate_doc(module_record, md_document)
+            with self.profiler.stage("write", module_name):
+                is_written = md_document.write()
+        finally:
+            md_document.close()
+
+        if self._low_memory:
+            module_record.release()
+            # interned import strings of released records would be kept forever
+            ImportString.clear_cache()
+        if output_path in self._error_output_paths:
+            return is_written, None
+
+        return is_written, DocDependencies(
+            links=sorted(self._link_dependencies), tree=sorted(self._tree_dependencies)
+        )
+
+    def _write_docs(
+        self, module_records: List[ModuleRecord]
+    ) -> Iterator[Tuple[bool, Optional[DocDependencies]]]:
+        """
+        Render and write docs for `ModuleRecord` list.
+
+        If `jobs` is greater than 1, each worker process gets a lightweight snapshot
+        of the loaded project from `create_worker_snapshot`, and each task sends
+        a full record to render.
+
+        Yields:
+            `_write_doc` results in the same order.
+        """
+        if self._jobs < 2 or len(module_records) < 2:
+            for module_record in module_records:
+                yield self._write_doc(module_record)
+            return
+
+        self._logger.debug(f"Rendering docs with {self._jobs} workers")
+        initargs: Tuple["Generator", int] = (self.create_worker_snapshot(), self._logger.level)
+        with ProcessPoolExecutor(
+            max_workers=self._jobs, initializer=_init_worker, initargs=initargs
+        ) as executor:
+            futures = [
+                executor.submit(_write_doc_in_worker, module_record)
+                for module_record in module_records
+            ]
+            try:
+                for future in futures:
+                    is_written, dependencies, profile_records, entries = future.result()
+                    self.profiler.add_records(profile_records)
+                    self.section_map_cache.add_entries(entries)
+                    yield is_written, dependencies
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _get_settings_key(self) -> str:
+        """
+        Get a hash of settings and module list that affect every doc.
+        """
+        return get_hash(
+            get_version(),
+            self._project_name,
+            self._root_path.as_posix(),
+            self._output_path.as_posix(),
+            str(self._toc_depth),
+            self._source_code_url or "",
+            self._source_code_path.as_posix(),
+            self._encoding,
+            self._docstring_processor.get_settings_key(),
+            self.md_index.title,
+            self.md_modules.title,
+            *(i.import_string.value for i in self._module_records),
+        )
+
+    def _get_fingerprints(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Get module fingerprints for the dependency graph.
+
+        Tree fingerprint covers only data used in ToC and breadcrumbs,
+        full fingerprint covers module source as well.
+
+        Returns:
+            A tuple of full and tree fingerprints by module import string.
+        """
+        fingerprints: Dict[str, str] = {}
+        tree_fingerprints: Dict[str, str] = {}
+        for module_record in self._module_records:
+            name = module_record.import_string.value
+            tree_fingerprints[name] = get_hash(name, module_record.title)
+            fingerprints[name] = get_hash(
+                tree_fingerprints[name],
+                module_record.docstring,
+                "\n".join(module_record.source_lines),
+            )
+
+        return fingerprints, tree_fingerprints
+
     def generate_docs(self) -> None:
         """
         Generate all doc files at once.
+
+        If `incremental` is set, renders only docs with changed
+        sources or dependencies since the previous run.
         """
+        self._generate_docs(incremental=self._incremental)
+
+    def _generate_docs(self, incremental: bool) -> None:
+        # memoized paths and interned import strings are scoped to a single run
+        PathFinder.clear_cache()
+        ImportString.clear_cache()
+        self._loader.clear_cache()
+        # docstring style is locked per run, so style changes are picked up on rerun
+        self._docstring_processor.reset_style()
+
         output_path_str = self._root_path_finder.relative(self._output_path)
         self._logger.debug(f"Generating docs for {self._project_name} to {output_path_str}")
 
-        for module_record in self._module_records:
-            output_path = self._loader.get_output_path(module_record.source_path)
-            md_document = MDDocument(output_path, encoding=self._encoding)
-            self._generate_doc(module_record, md_document)
-            md_document.write()
+        module_records = list(self._module_records)
+        fingerprints, tree_fingerprints = self._get_fingerprints()
+        self._dependency_graph.load(self._get_settings_key())
+
+        if incremental:
+            module_records = [
+                module_record
+                for module_record in module_records
+                if self._dependency_graph.is_outdated(
+                    module_record.import_string.value, fingerprints, tree_fingerprints
+                )
+                or not self._loader.get_output_path(module_record.source_path).exists()
+            ]
+            self._logger.info(
+                f"Rendering {len(module_records)} outdated of {len(fingerprints)} module docs"
+            )
+
+        written_count = 0
+        for module_record, (is_written, dependencies) in zip(
+            module_records, self._write_docs(module_records)
+        ):
+            written_count += is_written
+            if dependencies is None:
+                self._dependency_graph.remove(module_record.import_string.value)
+                continue
+
+            self._dependency_graph.add(
+                module_record.import_string.value, dependencies, fingerprints, tree_fingerprints
+            )
+
+        self._dependency_graph.save()
+        self.section_map_cache.save()
+        self._logger.info(
+            f"Written {written_count} module docs,"
+            f" {len(module_records) - written_count} are unchanged"
+        )
 
     def generate_index(self) -> None:
         """
@@ -330,7 +701,7 @@ class Generator:
         Also `Modules` section that contains a Tree of all modules in the project.
         """
         self._logger.debug(f"Generating {self._root_path_finder.relative(self.md_index.path)}")
-        with self.md_index as md_index:
+        with self.profiler.stage("index"), self.md_index as md_index:
             if not md_index.title:
                 md_index.title = f"{self._project_name} {self.INDEX_TITLE}"
 
@@ -357,7 +728,7 @@ class Generator:
         section that contains a Tree of all modules in the project.
         """
         self._logger.debug(f"Generating {self._root_path_finder.relative(self.md_modules.path)}")
-        with self.md_modules as md_modules:
+        with self.profiler.stage("modules"), self.md_modules as md_modules:
             if not md_modules.title:
                 md_modules.title = f"{self._project_name} {self.MODULES_TITLE}"
 
@@ -414,6 +785,72 @@ class Generator:
                 module_record=module_record, record=record, md_document=md_document
             )
 
+    def _resolve_link(
+        self,
+        module_record: ModuleRecord,
+        record: NodeRecord,
+        related_record_name: str,
+    ) -> Optional[Tuple[NodeRecord, Optional[ModuleRecord]]]:
+        """
+        Find a record referenced by `related_record_name` in `record` docstring.
+
+        Record is looked up in `record` parent, in `module_record` and in the whole project.
+        Result depends only on module, `record` parent and whether `related_record_name`
+        is `record` own name, so it is memoized by them. Memo is cleared for each doc,
+        because global lookups add found modules to the doc link dependencies.
+
+        Arguments:
+            module_record -- Parent ModuleRecord
+            record -- Record with a docstring
+            related_record_name -- Referenced object name or import string
+
+        Returns:
+            A tuple of found record and its `ModuleRecord` if it was found globally,
+            or None if record is not found.
+        """
+        parent_import_string = None
+        is_own_name = False
+        if not record.import_string.is_top_level():
+            parent_import_string = record.import_string.parent
+            own_name = record.import_string.value[len(parent_import_string.value) + 1 :]
+            is_own_name = related_record_name == own_name
+        key = (
+            module_record.import_string.value,
+            parent_import_string.value if parent_import_string else "",
+            related_record_name,
+            is_own_name,
+        )
+        if key in self._link_cache:
+            return self._link_cache[key]
+
+        result: Optional[Tuple[NodeRecord, Optional[ModuleRecord]]] = None
+        related_record = None
+
+        # find record in parent
+        if parent_import_string and not is_own_name:
+            related_record = module_record.find_record(parent_import_string + related_record_name)
+
+        # find record in module
+        if not related_record:
+            related_record = module_record.find_record(
+                module_record.import_string + related_record_name
+            )
+
+        if related_record:
+            result = (related_record, None)
+
+        # find record globally
+        if not related_record:
+            related_import_string = ImportString(related_record_name)
+            related_module_record = self._find_module_record(related_import_string)
+            if related_module_record:
+                related_record = related_module_record.find_record(related_import_string)
+                if related_record:
+                    result = (related_record, related_module_record)
+
+        self._link_cache[key] = result
+        return result
+
     def _replace_links(
         self,
         module_record: ModuleRecord,
@@ -421,42 +858,41 @@ class Generator:
         md_document: MDDocument,
         docstring: str,
     ) -> str:
-        parent_import_string = None
-        if not record.import_string.is_top_level():
-            parent_import_string = record.import_string.parent
+        """
+        Replace short links to other records in a docstring in a single pass.
 
-        for match in self._short_link_re.findall(docstring):
-            related_record_name = match.replace("`", "")
-            related_import_string = None
-            related_record = None
-            target_path = md_document.path
+        Arguments:
+            module_record -- Parent ModuleRecord
+            record -- Record with a docstring
+            md_document -- Output document.
+            docstring -- Docstring with short links.
 
-            # find record in parent
-            if parent_import_string:
-                related_import_string = parent_import_string + related_record_name
-                if related_import_string != record.import_string:
-                    related_record = module_record.find_record(related_import_string)
+        Returns:
+            A docstring with Markdown links.
+        """
+        if "`" not in docstring:
+            return docstring
 
-            # find record in module
-            if not related_record:
-                related_import_string = module_record.import_string + related_record_name
-                related_record = module_record.find_record(related_import_string)
+        links: Dict[str, str] = {}
 
-            # find record globally
-            if not related_record:
-                related_import_string = ImportString(related_record_name)
-                related_module_record = self._module_records.find_module_record(
-                    related_import_string
-                )
-                if related_module_record:
-                    related_record = related_module_record.find_record(related_import_string)
-                    target_path = self._loader.get_output_path(related_module_record.source_path)
+        def replace_link(match: Match[str]) -> str:
+            match_str = match.group()
+            if match_str not in links:
+                links[match_str] = render_link(match_str)
+            return links[match_str]
 
-            if not related_record:
-                continue
+        def render_link(match_str: str) -> str:
+            resolved = self._resolve_link(module_record, record, match_str.replace("`", ""))
+            if not resolved:
+                return match_str
 
+            related_record, related_module_record = resolved
             if related_record.import_string.startswith(record.import_string):
-                continue
+                return match_str
+
+            target_path = md_document.path
+            if related_module_record:
+                target_path = self._loader.get_output_path(related_module_record.source_path)
 
             title = related_record.title
             anchor = md_document.get_anchor(related_record.title)
@@ -467,10 +903,10 @@ class Generator:
                 if parent_related_record:
                     anchor = md_document.get_anchor(parent_related_record.title)
 
-            link = md_document.render_doc_link(title, anchor=anchor, target_path=target_path)
-            docstring = docstring.replace(match, link)
             self._logger.debug(f"Adding local link '{title}' to '{record.title}'")
-        return docstring
+            return md_document.render_doc_link(title, anchor=anchor, target_path=target_path)
+
+        return self._short_link_re.sub(replace_link, docstring)
 
     def _render_docstring(
         self,
@@ -491,10 +927,13 @@ class Generator:
         Returns:
             A module docstring with valid markdown.
         """
+        module_name = module_record.import_string.value
         docstring = record.docstring
-        docstring = self._replace_links(module_record, record, md_document, docstring)
+        with self.profiler.stage("links", module_name):
+            docstring = self._replace_links(module_record, record, md_document, docstring)
 
-        section_map = self._docstring_processor.build_sections(docstring)
+        with self.profiler.stage("docstrings", module_name):
+            section_map = self._docstring_processor.build_sections(docstring)
 
         for attrubute in record.get_documented_attribute_strings():
             section_map.add_line_indent("Attributes", f"- {attrubute}")
@@ -503,7 +942,7 @@ class Generator:
         links = []
         title = ""
         for import_string in related_import_strings:
-            related_module_record = self._module_records.find_module_record(import_string)
+            related_module_record = self._find_module_record(import_string)
             if not related_module_record:
                 continue
 
@@ -538,15 +977,9 @@ class Generator:
         lines: List[str] = []
         parts = import_string.parts
 
-        last_import_string_parts: List[str] = []
-        for module_record in self._module_records:
+        last_import_string_parts: Tuple[str, ...] = ()
+        for module_record in self._module_records.get_descendants(import_string):
             output_path = self._loader.get_output_path(module_record.source_path)
-            if module_record.import_string == import_string:
-                continue
-
-            if import_string and not module_record.import_string.startswith(import_string):
-                continue
-
             import_string_parts = module_record.import_string.parts
             if len(import_string_parts) > len(parts) + max_depth:
                 continue
@@ -566,6 +999,7 @@ class Generator:
                 lines.append(toc_line)
 
             last_import_string_parts = import_string_parts
+            self._tree_dependencies.add(module_record.import_string.value)
             link = md_document.render_doc_link(
                 title=module_record.title,
                 target_path=output_path,
@@ -1,13 +1,16 @@
 """
 Loader for python source code.
 """
-
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+import handsdown.ast_parser.smart_ast as ast
 from handsdown.ast_parser.node_records.module_record import ModuleRecord
+from handsdown.ast_parser.node_records.node_record import NodeRecord
 from handsdown.settings import ENCODING
-from handsdown.utils import extract_md_title
+from handsdown.utils import extract_md_title, get_version
+from handsdown.utils.file_cache import FileCache
 from handsdown.utils.import_string import ImportString
 from handsdown.utils.logger import get_logger
 from handsdown.utils.path_finder import PathFinder
@@ -32,14 +35,50 @@ class Loader:
         root_path -- Root path of the project.
         output_path -- Docs output path.
         encoding -- File encoding.
+        cache -- Cache for loaded `ModuleRecord` objects.
     """
 
-    def __init__(self, root_path: Path, output_path: Path, encoding: str = ENCODING) -> None:
+    # Cached `ModuleRecord` format version, bump it on record behavior changes,
+    # record attribute changes are detected by `_get_record_schema`
+    CACHE_VERSION = "5"
+
+    def __init__(
+        self,
+        root_path: Path,
+        output_path: Path,
+        encoding: str = ENCODING,
+        cache: Optional[FileCache] = None,
+    ) -> None:
         self._logger = get_logger()
         self._root_path = root_path
         self._root_path_finder = PathFinder(self._root_path)
         self._output_path = output_path
         self._encoding = encoding
+        self._cache = cache
+        self._output_paths: Dict[Path, Path] = {}
+        self._cache_key_parts = (
+            self.CACHE_VERSION,
+            get_version(),
+            self._get_record_schema(),
+            sys.version,
+            ast.Module.__module__,
+            encoding,
+        )
+
+    @staticmethod
+    def _get_record_schema() -> str:
+        """
+        Get a string that changes when attributes of any record class change.
+        """
+        parts = []
+        record_classes = [NodeRecord]
+        while record_classes:
+            record_class = record_classes.pop()
+            record_classes.extend(record_class.__subclasses__())
+            slots = ",".join(getattr(record_class, "__slots__", ()))
+            parts.append(f"{record_class.__module__}.{record_class.__qualname__}:{slots}")
+
+        return ";".join(sorted(parts))
 
     def get_output_path(self, source_path: Path) -> Path:
         """
@@ -51,6 +90,20 @@ class Loader:
         Returns:
             A path to the output `.md` file even if it does not exist yet.
         """
+        output_path = self._output_paths.get(source_path)
+        if output_path is None:
+            output_path = self._get_output_path(source_path)
+            self._output_paths[source_path] = output_path
+
+        return output_path
+
+    def clear_cache(self) -> None:
+        """
+        Clear memoized output paths.
+        """
+        self._output_paths.clear()
+
+    def _get_output_path(self, source_path: Path) -> Path:
         relative_source_path = self._root_path_finder.relative(source_path)
         if relative_source_path.stem == "__init__":
             relative_source_path = relative_source_path.parent / "index"
@@ -84,12 +137,7 @@ class Loader:
         docstring_parts = []
 
         try:
-            module_record = ModuleRecord.create_from_source(
-                source_path=source_path,
-                import_string=ImportString(import_string),
-                encoding=self._encoding,
-            )
-            module_record.build_children()
+            module_record = self._load_module_record(source_path, ImportString(import_string))
         except Exception as e:
             raise LoaderError(
                 f"{e.__class__.__name__} while loading {source_path.as_posix()}: {e}"
@@ -111,6 +159,52 @@ class Loader:
 
         return module_record
 
+    def _load_module_record(self, source_path: Path, import_string: ImportString) -> ModuleRecord:
+        """
+        Create `ModuleRecord` with symbols from `source_path` or get it from cache.
+
+        Cache key includes source content, so changed files are always parsed again.
+        Cached records are fully parsed, so warm runs skip `ast.parse` and children parsing.
+        """
+        if not self._cache:
+            module_record = ModuleRecord.create_from_source(
+                source_path=source_path,
+                import_string=import_string,
+                encoding=self._encoding,
+            )
+            module_record.build_symbols()
+            return module_record
+
+        content = source_path.read_text(encoding=self._encoding)
+        cache_key = self._cache.get_key(*self._cache_key_parts, import_string.value, content)
+        cached_module_record = self._cache.get(cache_key)
+        if isinstance(cached_module_record, ModuleRecord):
+            cached_module_record.source_path = source_path
+            return cached_module_record
+
+        module_record = self._create_stripped_module_record(content, source_path, import_string)
+        try:
+            module_record.parse()
+        except Exception:  # pylint: disable=broad-except
+            # not cached, parse error is reported when module doc is rendered
+            return self._create_stripped_module_record(content, source_path, import_string)
+
+        self._cache.set(cache_key, module_record)
+        return module_record
+
+    @staticmethod
+    def _create_stripped_module_record(
+        content: str, source_path: Path, import_string: ImportString
+    ) -> ModuleRecord:
+        module_record = ModuleRecord.create_from_content(
+            content=content,
+            source_path=source_path,
+            import_string=import_string,
+        )
+        module_record.build_symbols()
+        module_record.strip_bodies()
+        return module_record
+
     @staticmethod
     def parse_module_record(module_record: ModuleRecord) -> None:
         """
@@ -5,10 +5,13 @@ import sys
 
 from handsdown.cli_parser import CLINamespace, parse_args
 from handsdown.generator import Generator, GeneratorError
-from handsdown.settings import EXCLUDE_EXPRS, SOURCES_GLOB
+from handsdown.processors.smart import SmartDocstringProcessor
+from handsdown.settings import CACHE_PATH_NAME, EXCLUDE_EXPRS, SOURCES_GLOB
 from handsdown.utils import make_title, render_asset
 from handsdown.utils.logger import get_logger
 from handsdown.utils.path_finder import PathFinder
+from handsdown.utils.profiler import Profiler
+from handsdown.watcher import Watcher
 
 
 def create_external_configs(namespace: CLINamespace) -> None:
@@ -46,21 +49,31 @@ def main() -> None:
     args = parse_args(sys.argv[1:])
     logger = get_logger(level=args.log_level)
 
+    profiler = Profiler(enabled=args.profile is not None)
     path_finder = (
         PathFinder(args.input_path).exclude(*(EXCLUDE_EXPRS + args.exclude)).include(*args.include)
     )
+    with profiler.stage("discovery"):
+        source_paths = list(path_finder.glob(SOURCES_GLOB))
 
     try:
         generator = Generator(
             project_name=args.project_name,
             input_path=args.input_path,
             output_path=args.output_path,
-            source_paths=path_finder.glob(SOURCES_GLOB),
+            source_paths=source_paths,
             raise_errors=args.panic,
             source_code_url=args.get_source_code_url(),
             source_code_path=args.source_code_path,
             toc_depth=args.toc_depth,
             encoding=args.encoding,
+            jobs=args.jobs,
+            cache_path=None if args.no_cache else args.input_path / CACHE_PATH_NAME,
+            incremental=args.incremental,
+            profiler=profiler,
+            stream=args.stream,
+            low_memory=args.low_memory,
+            docstring_processor=SmartDocstringProcessor(lock_after=args.lock_style),
         )
         if args.files:
             for path in args.files:
@@ -74,6 +87,14 @@ def main() -> None:
 
         if args.source_code_url:
             create_external_configs(args)
+
+        if args.profile:
+            logger.info(f"Writing profile to {args.profile.as_posix()}")
+            profiler.write(args.profile)
+            profiler.log_summary()
+
+        if args.watch:
+            Watcher(generator, path_finder, cleanup=args.cleanup).watch()
     except GeneratorError as e:
         logger.error(e)
         sys.exit(1)
@@ -63,7 +63,6 @@ class MDDocument:
 
     def __init__(self, path: Path, encoding: str = ENCODING) -> None:
         self._sections: List[str] = []
-        self._content = ""
         self._title = ""
         self._subtitle = ""
         self._toc_section = ""
@@ -83,7 +82,10 @@ class MDDocument:
         if exc_value:
             traceback.print_tb(tb)
             raise exc_value
-        return self.write()
+        try:
+            self.write()
+        finally:
+            self.close()
 
     def read(self, source_path: Optional[Path] = None) -> None:
         """
@@ -94,10 +96,9 @@ class MDDocument:
             encoding -- File encoding.
         """
         path = source_path or self._path
-        self._content = path.read_text(encoding=self._encoding)
         self._title = ""
         self._toc_section = ""
-        title, content = extract_md_title(self._content)
+        title, content = extract_md_title(path.read_text(encoding=self._encoding))
         if title:
             self._title = title
 
@@ -239,7 +240,7 @@ class MDDocument:
 
         return self.render_link(title, link)
 
-    def _build_content(self) -> str:
+    def _get_header_sections(self) -> List[str]:
         sections = []
         if self._title:
             sections.append(f"# {self._title}")
@@ -248,16 +249,55 @@ class MDDocument:
         if self._toc_section:
             sections.append(self._toc_section)
 
+        return sections
+
+    def _build_content(self) -> str:
+        sections = self._get_header_sections()
         sections.extend(self._sections)
         return self._section_separator.join(sections) + "\n"
 
-    def write(self) -> None:
+    def _is_unchanged(self, data: bytes) -> bool:
+        """
+        Check if `path` already has `data`, comparing sizes before reading the file.
         """
-        Write MD content to `path`.
+        try:
+            if self._path.stat().st_size != len(data):
+                return False
+            return self._path.read_bytes() == data
+        except OSError:
+            return False
+
+    def write(self) -> bool:
         """
-        content = self._build_content()
+        Write MD content to `path` if it differs from the existing file.
+
+        Unchanged files are not touched, so their modification time is preserved.
+
+        Returns:
+            True if file was written, False if it is unchanged.
+        """
+        data = self.content.encode(self._encoding)
+        if self._is_unchanged(data):
+            return False
+
         self.path_finder.mkdir()
-        self._path.write_text(content, encoding=self._encoding)
+        self._path.write_bytes(data)
+        return True
+
+    def close(self) -> None:
+        """
+        Release resources held by the document.
+        """
+
+    @property
+    def content(self) -> str:
+        """
+        Full document content.
+
+        Content is assembled on access, so building a document is linear
+        in the number of sections.
+        """
+        return self._build_content()
 
     @property
     def title(self) -> str:
@@ -269,7 +309,6 @@ class MDDocument:
     @title.setter
     def title(self, title: str) -> None:
         self._title = title
-        self._content = self._build_content()
 
     @property
     def subtitle(self) -> str:
@@ -281,7 +320,6 @@ class MDDocument:
     @subtitle.setter
     def subtitle(self, subtitle: str) -> None:
         self._subtitle = subtitle
-        self._content = self._build_content()
 
     @property
     def toc_section(self) -> str:
@@ -293,7 +331,6 @@ class MDDocument:
     @toc_section.setter
     def toc_section(self, toc_section: str) -> None:
         self._toc_section = toc_section
-        self._content = self._build_content()
 
     @property
     def sections(self) -> List[str]:
@@ -323,12 +360,10 @@ class MDDocument:
         if not content:
             return
 
-        if not self.subtitle and not self.sections and not content.startswith("#"):
+        if not self.subtitle and not self._has_sections() and not content.startswith("#"):
             self.subtitle = content
         else:
-            self._sections.append(content)
-
-        self._content = self._build_content()
+            self._append_section(content)
 
     def append_title(self, title: str, level: int) -> None:
         """
@@ -343,8 +378,19 @@ class MDDocument:
         """
         section_level = "#" * level
         section = f"{section_level} {self._escape_title(title)}"
+        self._append_section(section)
+
+    def _append_section(self, section: str) -> None:
         self._sections.append(section)
-        self._content = self._build_content()
+
+    def _has_sections(self) -> bool:
+        return bool(self._sections)
+
+    def _get_toc_sections(self) -> List[str]:
+        """
+        Get sections that can contain ToC headers.
+        """
+        return self._sections
 
     def generate_toc_section(self, max_depth: int = 3) -> str:
         """
@@ -362,7 +408,7 @@ class MDDocument:
             toc_line = self.get_toc_line(link, level=0)
             toc_lines.append(toc_line)
 
-        sections = [self.title, self.subtitle] + self.sections
+        sections = [self.title, self.subtitle] + self._get_toc_sections()
         for section in sections:
             if not section.startswith("#"):
                 continue
@@ -0,0 +1,152 @@
+"""
+Markdown file builder that keeps document sections on disk.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO, List, Optional
+
+from handsdown.md_document import MDDocument
+from handsdown.settings import ENCODING
+
+__all__ = ["MDStreamDocument"]
+
+
+class MDStreamDocument(MDDocument):
+    """
+    Markdown file builder that keeps document sections on disk.
+
+    Sections are written to a temporary file as they are appended, only title,
+    subtitle, ToC and single-line headers stay in memory. On `write` the header
+    is written to a temporary file next to `path`, sections are copied after it
+    and the result is atomically renamed to `path`. So ToC is still at the top
+    of the document and peak memory does not depend on document size.
+
+    Examples::
+
+        with MDStreamDocument(path=Path('output.md')) as md_document:
+            md_document.title = 'My doc'
+            md_document.append_title('New section', level=2)
+            md_document.append('New line')
+            md_document.add_toc_if_not_exists()
+
+    Arguments:
+        path -- Path to store document.
+        encoding -- File encoding.
+    """
+
+    # Chunk size in bytes to compare and copy files
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, path: Path, encoding: str = ENCODING) -> None:
+        super().__init__(path, encoding=encoding)
+        self._sections_file: Optional[IO[bytes]] = None
+        self._separator_data = self._section_separator.encode(encoding)
+
+    def read(self, source_path: Optional[Path] = None) -> None:
+        """
+        Read and parse content from `source_path`.
+
+        Arguments:
+            source_path -- Input file path. If not provided - `path` is used.
+        """
+        self.close()
+        super().read(source_path)
+        sections = self._sections
+        self._sections = []
+        for section in sections:
+            self._append_section(section)
+
+    def _append_section(self, section: str) -> None:
+        if self._sections_file is None:
+            self._sections_file = tempfile.TemporaryFile()  # pylint: disable=consider-using-with
+        else:
+            self._sections_file.write(self._separator_data)
+
+        self._sections_file.write(section.encode(self._encoding))
+        if section.startswith("#") and "\n" not in section:
+            self._sections.append(section)
+
+    def _has_sections(self) -> bool:
+        return self._sections_file is not None
+
+    @property
+    def sections(self) -> List[str]:
+        """
+        All non-special `sections` of the document, read from disk.
+        """
+        if self._sections_file is None:
+            return []
+
+        self._sections_file.seek(0)
+        data = self._sections_file.read().decode(self._encoding)
+        self._sections_file.seek(0, os.SEEK_END)
+        return data.split(self._section_separator)
+
+    def _build_content(self) -> str:
+        sections = self._get_header_sections()
+        sections.extend(self.sections)
+        return self._section_separator.join(sections) + "\n"
+
+    def _write_to(self, stream: IO[bytes]) -> None:
+        header_sections = self._get_header_sections()
+        stream.write(self._section_separator.join(header_sections).encode(self._encoding))
+        if self._sections_file is not None:
+            if header_sections:
+                stream.write(self._separator_data)
+            self._sections_file.seek(0)
+            shutil.copyfileobj(self._sections_file, stream, self.CHUNK_SIZE)
+        stream.write(b"\n")
+
+    def _is_same_file(self, temp_path: Path) -> bool:
+        """
+        Check if `path` has the same data as `temp_path`, comparing sizes first.
+        """
+        try:
+            if self._path.stat().st_size != temp_path.stat().st_size:
+                return False
+
+            with self._path.open("rb") as stream, temp_path.open("rb") as temp_stream:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if chunk != temp_stream.read(self.CHUNK_SIZE):
+                        return False
+                    if not chunk:
+                        return True
+        except OSError:
+            return False
+
+    def write(self) -> bool:
+        """
+        Write MD content to `path` if it differs from the existing file.
+
+        Content is written to a temporary file first and renamed, so
+        unchanged files are not touched and readers never see a partial file.
+
+        Returns:
+            True if file was written, False if it is unchanged.
+        """
+        self.path_finder.mkdir()
+        temp_path = self._path.with_name(f".{self._path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_path.open("wb") as temp_stream:
+                self._write_to(temp_stream)
+
+            if self._is_same_file(temp_path):
+                return False
+
+            os.replace(temp_path, self._path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        return True
+
+    def close(self) -> None:
+        """
+        Remove temporary sections file.
+        """
+        if self._sections_file is not None:
+            self._sections_file.close()
+            self._sections_file = None
@@ -19,9 +19,11 @@ Base class for all docstring processors:
   or line not starting with `>>>` or `...`
 """
 
-from typing import Dict, Optional, Pattern, Tuple
+import re
+from typing import Dict, Iterable, Optional, Pattern, Tuple
 
 from handsdown.processors.section_map import SectionMap
+from handsdown.processors.section_map_cache import SectionMapCache
 from handsdown.utils.indent_trimmer import IndentTrimmer
 
 
@@ -39,7 +41,14 @@ class BaseDocstringProcessor:
     section_name_map: Dict[str, str] = {}
     replace_map: Dict[str, str] = {}
 
+    # Characters that cannot start a literal regexp prefix
+    _re_special_chars = frozenset(".^$*+?{}[]()|\\")
+
     def __init__(self) -> None:
+        self._replace_re = self._compile_replace_re(self.replace_map)
+        self._line_re_fallback, self._line_re_dispatch = self._build_line_re_dispatch(
+            self.line_re_map
+        )
         self.current_section_name = ""
         self._in_codeblock = False
         self._in_doctest_block = False
@@ -50,6 +59,129 @@ class BaseDocstringProcessor:
         self._codeblock_lines_count = 0
         self.section_map = SectionMap()
         self._current_indent = 0
+        self._section_map_cache: Optional[SectionMapCache] = None
+
+    def set_section_map_cache(self, section_map_cache: Optional[SectionMapCache]) -> None:
+        """
+        Set a cache of parsed docstrings, so repeated docstrings are parsed once.
+
+        Arguments:
+            section_map_cache -- Shared cache or None to disable caching.
+        """
+        self._section_map_cache = section_map_cache
+
+    def get_settings_key(self) -> str:
+        """
+        Get a string that identifies processor output settings.
+        """
+        return self.__class__.__name__
+
+    def reset_style(self) -> None:
+        """
+        Forget docstring style detected for previous docstrings.
+
+        Called before each docs generation run, does nothing by default.
+        """
+
+    @staticmethod
+    def _compile_replace_re(replace_map: Dict[str, str]) -> Optional[Pattern[str]]:
+        """
+        Compile a regexp that matches any `replace_map` key.
+        """
+        if not replace_map:
+            return None
+
+        return re.compile("|".join(re.escape(i) for i in replace_map))
+
+    @classmethod
+    def _get_first_char(cls, line_re: Pattern[str]) -> Optional[str]:
+        """
+        Get a literal character every line matched by `line_re` starts with.
+
+        Returns:
+            A character or None if it cannot be detected.
+        """
+        if line_re.flags & (re.IGNORECASE | re.VERBOSE):
+            return None
+
+        expr = line_re.pattern
+        if expr.startswith("^"):
+            expr = expr[1:]
+
+        # leading group, character class or escape
+        if not expr or expr[0] in cls._re_special_chars:
+            return None
+
+        # other alternatives can start with any character
+        if cls._has_top_level_alternation(expr):
+            return None
+
+        # first character is optional
+        if expr[1:2] in ("*", "?", "{"):
+            return None
+
+        return expr[0]
+
+    @staticmethod
+    def _has_top_level_alternation(expr: str) -> bool:
+        """
+        Check if regexp `expr` has `|` outside of groups and character classes.
+        """
+        depth = 0
+        in_class = False
+        class_expr = ""
+        is_escaped = False
+        for char in expr:
+            if is_escaped:
+                is_escaped = False
+                class_expr += char
+            elif char == "\\":
+                is_escaped = True
+                class_expr += char
+            elif in_class:
+                # `]` is a literal at the start of a class
+                in_class = char != "]" or class_expr in ("", "^")
+                class_expr += char
+            elif char == "[":
+                in_class = True
+                class_expr = ""
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and not depth:
+                return True
+
+        return False
+
+    @classmethod
+    def _build_line_re_dispatch(
+        cls, line_re_map: Iterable[Tuple[Pattern[str], str]]
+    ) -> Tuple[
+        Tuple[Tuple[Pattern[str], str], ...], Dict[str, Tuple[Tuple[Pattern[str], str], ...]]
+    ]:
+        """
+        Group `line_re_map` by the first line character.
+
+        Each group keeps the original order of regexps that can match a line
+        starting with this character, so the first match stays the same.
+
+        Returns:
+            A tuple of regexps for lines starting with any other character
+            and regexp groups by the first line character.
+        """
+        items = [
+            (cls._get_first_char(line_re), line_re, line_format)
+            for line_re, line_format in line_re_map
+        ]
+        fallback = tuple((i[1], i[2]) for i in items if i[0] is None)
+        dispatch: Dict[str, Tuple[Tuple[Pattern[str], str], ...]] = {}
+        for first_char in {i[0] for i in items if i[0] is not None}:
+            dispatch[first_char] = tuple(
+                (i[1], i[2]) for i in items if i[0] is None or i[0] == first_char
+            )
+
+        return fallback, dispatch
 
     def _reset(self) -> None:
         self.current_section_name = ""
@@ -74,6 +206,18 @@ class BaseDocstringProcessor:
             A dictionary where key is a section name and value is a list of string sof this
             section.
         """
+        if self._section_map_cache is None:
+            return self._build_sections(content)
+
+        settings_key = self.get_settings_key()
+        section_map = self._section_map_cache.get(settings_key, content)
+        if section_map is None:
+            section_map = self._build_sections(content)
+            self._section_map_cache.set(settings_key, content, section_map)
+
+        return section_map
+
+    def _build_sections(self, content: str) -> SectionMap:
         self._reset()
 
         for line in content.split("\n"):
@@ -267,13 +411,16 @@ class BaseDocstringProcessor:
             return
 
         # replace occurences from `replace_map`
-        for target_str, replace_str in self.replace_map.items():
-            line = line.replace(target_str, replace_str)
+        if self._replace_re and self._replace_re.search(line):
+            for target_str, replace_str in self.replace_map.items():
+                line = line.replace(target_str, replace_str)
 
         # format line using `line_re_map` regexps
+        # only regexps that can match the first line character are checked
         # multiline result supported
         # if `section` found in match - set this section as active
-        for line_re, line_format in self.line_re_map:
+        line_re_items = self._line_re_dispatch.get(line[:1], self._line_re_fallback)
+        for line_re, line_format in line_re_items:
             match = line_re.match(line)
             if not match:
                 continue
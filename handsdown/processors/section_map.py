@@ -1,7 +1,7 @@
 """
 Module for splitting docstring into `Section` groups.
 """
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Tuple
 
 from handsdown.utils.indent_trimmer import IndentTrimmer
 
@@ -55,6 +55,10 @@ class Section:
         return "\n\n".join(result)
 
 
+# `SectionMap` as a tuple of section titles and lines of each section block
+SectionMapTuple = Tuple[Tuple[str, Tuple[Tuple[str, ...], ...]], ...]
+
+
 class SectionMap(dict):  # type: ignore
     """
     Dict-based storage for parsed `Section` list.
@@ -69,6 +73,38 @@ class SectionMap(dict):  # type: ignore
         super().__init__()
         self._order: List[str] = []
 
+    def to_tuple(self) -> SectionMapTuple:
+        """
+        Get an immutable copy of sections, used to cache parsed docstrings.
+
+        Returns:
+            A tuple of section titles and lines of each section block.
+        """
+        return tuple(
+            (section.title, tuple(tuple(block.lines) for block in section.blocks))
+            for section in self.sections
+        )
+
+    @classmethod
+    def from_tuple(cls, data: SectionMapTuple) -> "SectionMap":
+        """
+        Create a new `SectionMap` from `to_tuple` result.
+
+        Arguments:
+            data -- Section titles and lines of each section block.
+
+        Returns:
+            A new `SectionMap` instance.
+        """
+        section_map = cls()
+        for title, blocks in data:
+            section_map._order.append(title)  # pylint: disable=protected-access
+            section_map[title] = Section(
+                title=title, blocks=[SectionBlock(lines=lines) for lines in blocks]
+            )
+
+        return section_map
+
     def add_line_indent(self, section_name: str, line: str) -> None:
         """
         Add line respecting indent of the current section block.
@@ -0,0 +1,206 @@
+"""
+Size-bounded cache of parsed docstring sections.
+"""
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from handsdown.processors.section_map import SectionMap, SectionMapTuple
+from handsdown.settings import DOCSTRING_CACHE_SIZE
+from handsdown.utils import get_hash, get_version
+from handsdown.utils.logger import get_logger
+
+__all__ = ["SectionMapCache", "SectionMapCacheKey"]
+
+# Cache entry key: hash of processor settings key and docstring
+SectionMapCacheKey = str
+
+
+class SectionMapCache:
+    """
+    Size-bounded cache of parsed docstring sections.
+
+    Entries are keyed by a hash of processor settings key and docstring text, so
+    docstrings are not kept in memory, passed from workers or saved. Sections are
+    stored only when a docstring is seen for the second time, so unique docstrings
+    cost a single dict insert and repeated ones are parsed twice per project.
+    Least recently used entries are evicted first. If `path` is set, entries can be
+    saved and loaded on the next run.
+
+    Examples::
+
+        cache = SectionMapCache(Path(".handsdown_cache/section_maps.json"))
+        cache.load()
+        cache.set("PEP257DocstringProcessor", docstring, section_map)
+        cache.get("PEP257DocstringProcessor", docstring)
+        <SectionMap copy>
+        cache.save()
+
+    Arguments:
+        path -- Path to a file to store entries, entries are kept only in memory if not set.
+        max_size -- Maximum number of entries.
+    """
+
+    # Cache file format version
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None, max_size: int = DOCSTRING_CACHE_SIZE) -> None:
+        self._logger = get_logger()
+        self.path = path
+        self.max_size = max_size
+        self._entries: "OrderedDict[SectionMapCacheKey, Optional[SectionMapTuple]]" = OrderedDict()
+        self._new_entries: Dict[SectionMapCacheKey, SectionMapTuple] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # entries are not sent to worker processes, workers send back only new entries
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["_new_entries"] = {}
+        return state
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, processor_key: str, docstring: str) -> Optional[SectionMap]:
+        """
+        Get parsed sections for a `docstring`.
+
+        Arguments:
+            processor_key -- Settings key of the processor that parsed the docstring.
+            docstring -- Docstring text.
+
+        Returns:
+            A new `SectionMap` instance or None if docstring is not cached.
+        """
+        key = get_hash(processor_key, docstring)
+        data = self._entries.get(key)
+        if data is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return SectionMap.from_tuple(data)
+
+    def set(self, processor_key: str, docstring: str, section_map: SectionMap) -> None:
+        """
+        Store parsed sections for a `docstring` if it has been seen before.
+
+        Arguments:
+            processor_key -- Settings key of the processor that parsed the docstring.
+            docstring -- Docstring text.
+            section_map -- Parsed sections.
+        """
+        key = get_hash(processor_key, docstring)
+        if key not in self._entries:
+            self._entries[key] = None
+            self._evict()
+            return
+
+        data = section_map.to_tuple()
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        self._new_entries[key] = data
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop_new_entries(self) -> Dict[SectionMapCacheKey, SectionMapTuple]:
+        """
+        Get and clear entries added since the previous call.
+
+        Used to pass entries from worker processes to the main one.
+
+        Returns:
+            A dictionary of entries by key.
+        """
+        result = self._new_entries
+        self._new_entries = {}
+        return result
+
+    def add_entries(self, entries: Dict[SectionMapCacheKey, SectionMapTuple]) -> None:
+        """
+        Add entries created in another process.
+
+        Arguments:
+            entries -- Entries from `pop_new_entries`.
+        """
+        self._entries.update(entries)
+        self._evict()
+
+    def load(self) -> None:
+        """
+        Load entries from `path`.
+
+        Missing, broken or created by another `handsdown` version file is ignored.
+        """
+        if self.path is None:
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != self.VERSION or data.get("handsdown") != get_version():
+            return
+
+        raw_entries = data.get("entries")
+        if not isinstance(raw_entries, dict):
+            return
+
+        entries: "OrderedDict[SectionMapCacheKey, Optional[SectionMapTuple]]" = OrderedDict()
+        for key, raw_data in raw_entries.items():
+            entry = self._parse_entry(raw_data)
+            if entry is None:
+                self._logger.debug(f"Ignoring broken cache {self.path.as_posix()}")
+                return
+            entries[key] = entry
+
+        entries.update(self._entries)
+        self._entries = entries
+        self._evict()
+
+    @staticmethod
+    def _parse_entry(data: Any) -> Optional[SectionMapTuple]:
+        if not isinstance(data, list):
+            return None
+
+        result = []
+        for item in data:
+            if not isinstance(item, list) or len(item) != 2:
+                return None
+            title, blocks = item
+            if not isinstance(title, str) or not isinstance(blocks, list):
+                return None
+            for lines in blocks:
+                if not isinstance(lines, list) or not all(isinstance(i, str) for i in lines):
+                    return None
+            result.append((title, tuple(tuple(lines) for lines in blocks)))
+
+        return tuple(result)
+
+    def save(self) -> None:
+        """
+        Save entries to `path`.
+
+        Entries are written to a temporary file first and renamed, so
+        concurrent readers never see a partial file.
+        """
+        if self.path is None:
+            return
+
+        entries = {key: data for key, data in self._entries.items() if data is not None}
+        data = dict(version=self.VERSION, handsdown=get_version(), entries=entries)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temp_path_str = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w") as temp_file:
+                json.dump(data, temp_file)
+            os.replace(temp_path_str, self.path)
+        except OSError as e:
+            self._logger.warning(f"Cannot save docstring cache to {self.path.as_posix()}: {e}")
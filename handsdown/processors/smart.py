@@ -6,25 +6,105 @@ Docstring processor that selects a `DocstringProcessor` based on a docstring con
 - `handsdown.processors.pep257.PEP257DocstringProcessor`
 - `handsdown.processors.rst.RSTDocstringProcessor`
 """
+import re
+from typing import FrozenSet, Optional
+
 from handsdown.processors.base import BaseDocstringProcessor
 from handsdown.processors.pep257 import PEP257DocstringProcessor
 from handsdown.processors.rst import RSTDocstringProcessor
 from handsdown.processors.section_map import SectionMap
+from handsdown.processors.section_map_cache import SectionMapCache
 
 
 class SmartDocstringProcessor(BaseDocstringProcessor):
     """
     Docstring processor that selects a `DocstringProcessor` based on a docstring content.
+
+    If `lock_after` is set, the processor is fixed to a style after this number
+    of docstrings in a row are detected as the same style, so detection is skipped
+    for the rest of the project. Docstrings without PEP 257 sections, RST fields
+    or directives are not taken into account. A locked style is dropped and detection
+    starts over as soon as a docstring has markers of the other style.
+
+    Arguments:
+        lock_after -- Number of same style docstrings in a row to fix the style, `0` to disable.
     """
 
-    def __init__(self) -> None:
+    # RST field or directive line, e.g. `:param name: description` or `.. note::`
+    _rst_marker_re = re.compile(r"^\s*(?::\w+|\.\. \w+::)", re.MULTILINE)
+
+    def __init__(self, lock_after: int = 0) -> None:
         self._pep257_processor = PEP257DocstringProcessor()
         self._rst_processor = RSTDocstringProcessor()
+        self._pep257_keywords: FrozenSet[str] = frozenset(self._pep257_processor.section_name_map)
+        self.lock_after = lock_after
+        self._locked_processor: Optional[BaseDocstringProcessor] = None
+        self._last_processor: Optional[BaseDocstringProcessor] = None
+        self._same_style_count = 0
         super().__init__()
 
     def _parse_line(self, line: str) -> None:
         pass
 
+    def set_section_map_cache(self, section_map_cache: Optional[SectionMapCache]) -> None:
+        """
+        Set a cache of parsed docstrings for PEP 257 and RST processors.
+
+        Arguments:
+            section_map_cache -- Shared cache or None to disable caching.
+        """
+        self._pep257_processor.set_section_map_cache(section_map_cache)
+        self._rst_processor.set_section_map_cache(section_map_cache)
+
+    def get_settings_key(self) -> str:
+        """
+        Get a string that identifies processor output settings.
+        """
+        return f"{self.__class__.__name__}:{self.lock_after}"
+
+    def reset_style(self) -> None:
+        """
+        Forget detected style, so it is detected again for next docstrings.
+        """
+        self._locked_processor = None
+        self._last_processor = None
+        self._same_style_count = 0
+
+    def _is_pep257(self, content: str) -> bool:
+        # all section keywords end with a colon
+        if ":" not in content:
+            return False
+
+        return not self._pep257_keywords.isdisjoint(content.split("\n"))
+
+    def _has_other_style(self, processor: BaseDocstringProcessor, content: str) -> bool:
+        if processor is self._pep257_processor:
+            return self._rst_marker_re.search(content) is not None
+
+        return self._is_pep257(content)
+
+    def _detect_processor(self, content: str) -> BaseDocstringProcessor:
+        if self._is_pep257(content):
+            processor: BaseDocstringProcessor = self._pep257_processor
+        elif self.lock_after and self._rst_marker_re.search(content):
+            processor = self._rst_processor
+        else:
+            return self._rst_processor
+
+        if not self.lock_after:
+            return processor
+
+        if processor is self._last_processor:
+            self._same_style_count += 1
+        else:
+            self._last_processor = processor
+            self._same_style_count = 1
+
+        if self._same_style_count >= self.lock_after:
+            self._locked_processor = processor
+
+        return processor
+
     def build_sections(self, content: str) -> SectionMap:
         """
         Parse docstring and split it to sections with arrays of strings.
@@ -36,11 +116,10 @@ class SmartDocstringProcessor(BaseDocstringProcessor):
             A dictionary where key is a section name and value is a list of string sof this
             section.
         """
-        stripped_lines = content.split("\n")
-
-        pep257_keywords = self._pep257_processor.section_name_map.keys()
-        for keyword in pep257_keywords:
-            if keyword in stripped_lines:
-                return self._pep257_processor.build_sections(content)
-
-        return self._rst_processor.build_sections(content)
+        processor = self._locked_processor
+        if processor is not None and self._has_other_style(processor, content):
+            self.reset_style()
+            processor = None
+        if processor is None:
+            processor = self._detect_processor(content)
+        return processor.build_sections(content)
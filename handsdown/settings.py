@@ -15,3 +15,21 @@ FIND_IN_SOURCE_LABEL = "[find in source code]"
 
 # Default encoding for source files
 ENCODING = "utf-8"
+
+# Cache directory name, relative to project root
+CACHE_PATH_NAME = ".handsdown_cache"
+
+# Per-user directory for data that must not be stored in documented projects
+USER_CACHE_PATH_NAME = "handsdown"
+
+# Environment variable with a key to sign cache entries instead of a per-user key file
+CACHE_KEY_ENV_NAME = "HANDSDOWN_CACHE_KEY"
+
+# Maximum number of memoized relative paths
+RELATIVE_PATH_CACHE_SIZE = 65536
+
+# Maximum number of memoized docstrings and parsed docstring sections
+DOCSTRING_CACHE_SIZE = 16384
+
+# Source files poll interval in seconds for watch mode
+WATCH_INTERVAL = 0.5
@@ -1,14 +1,53 @@
 """
 Handful utils that do not deserve a separate module.
 """
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import importlib_resources as pkg_resources
+from pkg_resources import DistributionNotFound, get_distribution
 
 from handsdown import assets as assets_resource
 
 
+@lru_cache()
+def get_version() -> str:
+    """
+    Get installed `handsdown` package version.
+
+    Returns:
+        A version string or `0.0.0` if package is not installed.
+    """
+    try:
+        return get_distribution("handsdown").version
+    except DistributionNotFound:
+        return "0.0.0"
+
+
+def get_hash(*parts: str) -> str:
+    """
+    Get a stable hash of a combination of string `parts`.
+
+    Examples::
+
+        get_hash("my_module", "source")
+        "6c5f..."
+
+    Arguments:
+        parts -- Strings to hash.
+
+    Returns:
+        A hex digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def make_title(file_stem: str) -> str:
     """
     Convert `pathlib.Path` part or any other string to a human-readable title.
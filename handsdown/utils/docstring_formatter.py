@@ -1,9 +1,13 @@
 """
 Translator of docstrings to Markdown format.
 """
+from functools import lru_cache
+from typing import List
+
+from handsdown.settings import DOCSTRING_CACHE_SIZE
 from handsdown.utils.indent_trimmer import IndentTrimmer
 
-__all__ = ["DocstringFormatter"]
+__all__ = ["DocstringFormatter", "format_docstring"]
 
 
 class DocstringFormatter:
@@ -15,25 +19,21 @@ class DocstringFormatter:
     """
 
     def __init__(self, docstring: str) -> None:
-        docstring = self._cleanup(docstring)
-        docstring = IndentTrimmer.trim_empty_lines(docstring)
-        docstring = IndentTrimmer.trim_text(docstring)
-        lines = docstring.split("\n")
-        self._lines = IndentTrimmer.trim_lines(lines)
+        lines = self._cleanup(docstring.split("\n"))
+        self._lines = IndentTrimmer.trim_block(lines)
 
     @staticmethod
-    def _cleanup(docstring: str) -> str:
+    def _cleanup(lines: List[str]) -> List[str]:
         """
         Fix multiline docstrings starting with no newline after quotes.
 
         Arguments:
-            docstring -- Raw docstring.
+            lines -- Raw docstring lines.
 
         Returns:
-            Aligned docstring.
+            Aligned docstring lines.
         """
-        if "\n" in docstring and docstring[0] != "\n":
-            lines = docstring.split("\n")
+        if len(lines) > 1 and lines[0]:
             next_line_index = 1
             next_line = lines[next_line_index]
             while not next_line.strip() and next_line_index < len(lines) - 1:
@@ -42,9 +42,9 @@ class DocstringFormatter:
 
             indent = IndentTrimmer.get_line_indent(next_line)
             line_indent = " " * indent
-            docstring = f"\n{line_indent}{docstring}"
+            lines[0] = f"{line_indent}{lines[0]}"
 
-        return IndentTrimmer.trim_text(docstring)
+        return lines
 
     def _parse_flask_title(self) -> None:
         lines = list(self._lines)
@@ -63,3 +63,17 @@ class DocstringFormatter:
         """
         self._parse_flask_title()
         return "\n".join(self._lines)
+
+
+@lru_cache(maxsize=DOCSTRING_CACHE_SIZE)
+def format_docstring(docstring: str) -> str:
+    """
+    Get Markdown-friendly docstring, repeated docstrings are formatted once.
+
+    Arguments:
+        docstring -- Raw docstring.
+
+    Returns:
+        A cleaned up docstring.
+    """
+    return DocstringFormatter(docstring).render()
@@ -0,0 +1,251 @@
+"""
+Size-bounded on-disk cache for picklable objects.
+"""
+import gc
+import hashlib
+import hmac
+import os
+import pickle
+import secrets
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from handsdown.settings import CACHE_KEY_ENV_NAME, USER_CACHE_PATH_NAME
+from handsdown.utils import get_hash
+from handsdown.utils.logger import get_logger
+
+__all__ = ["FileCache", "get_user_cache_path", "get_secret_key"]
+
+# Secret key size in bytes
+SECRET_KEY_SIZE = 32
+
+# Secret key file name in user cache directory
+SECRET_KEY_NAME = "cache.key"
+
+
+def get_user_cache_path() -> Path:
+    """
+    Get per-user `handsdown` cache directory, respects `XDG_CACHE_HOME`.
+
+    Returns:
+        A path to a directory, it may not exist yet.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / USER_CACHE_PATH_NAME
+
+
+def get_secret_key(path: Optional[Path] = None) -> bytes:
+    """
+    Get a key to sign cache entries, create a per-user key file if it does not exist.
+
+    Key is stored outside of documented projects, so cache entries committed to
+    a repository or planted by someone else fail the check and are never unpickled.
+    If `HANDSDOWN_CACHE_KEY` environment variable is set and `path` is not, its value
+    is used instead, e.g. a CI secret to reuse a restored cache directory.
+    Missing or too short key file is rewritten, if it cannot be written,
+    a key for the current process is returned.
+
+    Arguments:
+        path -- Key file path, `<user cache>/cache.key` is used if not set.
+
+    Returns:
+        Key bytes.
+    """
+    if path is None:
+        env_key = os.environ.get(CACHE_KEY_ENV_NAME)
+        if env_key:
+            return env_key.encode("utf-8")
+
+    key_path = path or get_user_cache_path() / SECRET_KEY_NAME
+    try:
+        key = key_path.read_bytes()
+    except OSError:
+        key = b""
+    if len(key) >= SECRET_KEY_SIZE:
+        return key
+
+    key = secrets.token_bytes(SECRET_KEY_SIZE)
+    try:
+        key_path.parent.mkdir(parents=True, exist_ok=True)
+        # temporary file is readable only by the current user
+        file_descriptor, temp_path_str = tempfile.mkstemp(dir=key_path.parent, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as key_file:
+            key_file.write(key)
+        os.replace(temp_path_str, key_path)
+    except OSError as e:
+        get_logger().debug(f"Cannot store cache key to {key_path.as_posix()}: {e}")
+
+    return key
+
+
+class FileCache:
+    """
+    Size-bounded on-disk cache for picklable objects.
+
+    Each entry is stored in a separate file in `path`. Reading an entry updates
+    its modification time, so `cleanup` evicts least recently used entries first.
+    Cache is best-effort: unreadable or broken entries are treated as missing and
+    write errors are ignored.
+
+    Entries are signed with HMAC using `secret_key`, entries with a wrong signature
+    are ignored before unpickling, so cache directory contents cannot run code.
+
+    Examples::
+
+        cache = FileCache(Path(".handsdown_cache/modules"))
+        key = cache.get_key("my_module", source_code)
+        cache.set(key, {"name": "my_module"})
+        cache.get(key)
+        {"name": "my_module"}
+
+    Arguments:
+        path -- Path to cache directory.
+        max_size -- Maximum total size of entries in bytes.
+        secret_key -- Key to sign entries, key from `get_secret_key` is used if not set.
+    """
+
+    # Default maximum total size of entries in bytes
+    MAX_SIZE = 256 * 1024 * 1024
+
+    # Entry file suffix
+    SUFFIX = ".pickle"
+
+    def __init__(
+        self, path: Path, max_size: int = MAX_SIZE, secret_key: Optional[bytes] = None
+    ) -> None:
+        self._logger = get_logger()
+        self.path = path
+        self.max_size = max_size
+        self._secret_key = secret_key or get_secret_key()
+
+    @staticmethod
+    def get_key(*parts: str) -> str:
+        """
+        Get a cache key for a combination of string `parts`.
+
+        Arguments:
+            parts -- Strings that identify an entry.
+
+        Returns:
+            A hex digest.
+        """
+        return get_hash(*parts)
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.path / f"{key}{self.SUFFIX}"
+
+    def _sign(self, data: bytes) -> bytes:
+        return hmac.new(self._secret_key, data, hashlib.sha256).digest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get an entry by `key`.
+
+        Arguments:
+            key -- Entry key from `get_key`.
+
+        Returns:
+            A stored object or None if it is missing or cannot be loaded.
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            signed_data = entry_path.read_bytes()
+        except OSError:
+            return None
+
+        signature_size = hashlib.sha256().digest_size
+        signature, data = signed_data[:signature_size], signed_data[signature_size:]
+        if not hmac.compare_digest(signature, self._sign(data)):
+            self._logger.debug(f"Ignoring cache entry {entry_path.name} with a wrong signature")
+            return None
+
+        try:
+            result = self._loads(data)
+        except Exception as e:  # pylint: disable=broad-except
+            self._logger.debug(f"Ignoring broken cache entry {entry_path.name}: {e}")
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return result
+
+    @staticmethod
+    def _loads(data: bytes) -> Any:
+        """
+        Unpickle `data` with garbage collection paused.
+
+        Unpickled records create many container objects at once, and collections
+        triggered in the middle of unpickling take most of the load time.
+        """
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(data)
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store `value` by `key`.
+
+        Entry is written to a temporary file first and renamed, so
+        concurrent readers never see a partial entry.
+
+        Arguments:
+            key -- Entry key from `get_key`.
+            value -- Picklable object.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:  # pylint: disable=broad-except
+            self._logger.debug(f"Cannot cache {value!r}: {e}")
+            return
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temp_path_str = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(self._sign(data))
+                temp_file.write(data)
+            os.replace(temp_path_str, self._get_entry_path(key))
+        except OSError as e:
+            self._logger.debug(f"Cannot write cache entry to {self.path.as_posix()}: {e}")
+
+    def cleanup(self) -> None:
+        """
+        Remove least recently used entries until total size fits `max_size`.
+        """
+        entries: List[Tuple[float, int, Path]] = []
+        total_size = 0
+        try:
+            entry_paths = list(self.path.glob(f"*{self.SUFFIX}"))
+        except OSError:
+            return
+
+        for entry_path in entry_paths:
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        if total_size <= self.max_size:
+            return
+
+        entries.sort()
+        for _mtime, size, entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+
+        self._logger.debug(f"Cache {self.path.as_posix()} is cleaned up to {total_size} bytes")
@@ -1,7 +1,7 @@
 """
 Wrapper for python import strings.
 """
-from typing import Any, List
+from typing import Any, Dict, Optional, Tuple
 
 
 class ImportStringError(Exception):
@@ -14,12 +14,53 @@ class ImportString:
     """
     Wrapper for python import strings.
 
+    Immutable and interned: equal import strings are the same object, so
+    `parts`, `parent` and hash are computed only once per import string.
+    Intern table is cleared by `clear_cache`, instances created before and after
+    that are still equal, but no longer the same object.
+
     Arguments:
         value -- Import string.
     """
 
-    def __init__(self, value: str) -> None:
-        self.value = value
+    __slots__ = ("_value", "_parts", "_parent", "_hash")
+
+    _instances: Dict[str, "ImportString"] = {}
+
+    _value: str
+    _parts: Optional[Tuple[str, ...]]
+    _parent: Optional["ImportString"]
+    _hash: int
+
+    def __new__(cls, value: str) -> "ImportString":
+        instance = cls._instances.get(value)
+        if instance is not None:
+            return instance
+
+        instance = super().__new__(cls)
+        instance._value = value
+        instance._parts = None
+        instance._parent = None
+        instance._hash = hash(value)
+        cls._instances[value] = instance
+        return instance
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear interned instances, so unreferenced ones can be freed.
+        """
+        cls._instances.clear()
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return (self.__class__, (self._value,))
+
+    @property
+    def value(self) -> str:
+        """
+        Import string value.
+        """
+        return self._value
 
     def __str__(self) -> str:
         """
@@ -33,10 +74,10 @@ class ImportString:
         Returns:
             Original import string.
         """
-        return self.value
+        return self._value
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return self._hash
 
     def __add__(self, other: str) -> "ImportString":
         """
@@ -56,8 +97,8 @@ class ImportString:
         Returns:
             A new `ImportString` instance.
         """
-        if self.value:
-            return ImportString(f"{self.value}.{other}")
+        if self._value:
+            return ImportString(f"{self._value}.{other}")
 
         return ImportString(other)
 
@@ -76,7 +117,7 @@ class ImportString:
         Returns:
             True if not empty.
         """
-        return bool(self.value)
+        return bool(self._value)
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -105,31 +146,37 @@ class ImportString:
         Returns:
             True if import strings are equal.
         """
-        if isinstance(other, str):
-            return self.value == other
+        if other is self:
+            return True
 
         if isinstance(other, ImportString):
-            return self.value == other.value
+            return self._value == other._value  # pylint: disable=protected-access
+
+        if isinstance(other, str):
+            return self._value == other
 
         return False
 
     @property
-    def parts(self) -> List[str]:
+    def parts(self) -> Tuple[str, ...]:
         """
         Parts of import string splitted by dots.
 
         Examples::
 
-            ImportString("my_module.MyClass")
-            ["my_module", "MyClass"]
+            ImportString("my_module.MyClass").parts
+            ("my_module", "MyClass")
 
-            ImportString("")
-            []
+            ImportString("").parts
+            ("",)
 
         Returns:
-            A list of import string parts.
+            A tuple of import string parts.
         """
-        return self.value.split(".")
+        if self._parts is None:
+            self._parts = tuple(self._value.split("."))
+
+        return self._parts
 
     def is_top_level(self) -> bool:
         """
@@ -138,7 +185,7 @@ class ImportString:
         Returns:
             True if it has no parents.
         """
-        return "." not in self.value
+        return "." not in self._value
 
     @property
     def parent(self) -> "ImportString":
@@ -146,13 +193,15 @@ class ImportString:
         Parent import string.
 
         Returns:
-            A new `ImportString` instance.
+            An `ImportString` instance.
         """
-        if self.is_top_level():
-            raise ImportStringError("Import string is top level and has no parents.")
+        if self._parent is None:
+            if self.is_top_level():
+                raise ImportStringError("Import string is top level and has no parents.")
+
+            self._parent = ImportString(self._value.rsplit(".", 1)[0])
 
-        parent_import_string_parts = self.value.split(".")[:-1]
-        return ImportString(".".join(parent_import_string_parts))
+        return self._parent
 
     def startswith(self, import_string: "ImportString") -> bool:
         """
@@ -161,4 +210,9 @@ class ImportString:
         Returns:
             True if it is a child.
         """
-        return self.value.startswith(f"{import_string}.")
+        value = import_string.value
+        return (
+            len(self._value) > len(value)
+            and self._value[len(value)] == "."
+            and self._value.startswith(value)
+        )
@@ -2,7 +2,7 @@
 Utility for removing indentation for sections and lines.
 """
 
-from typing import Iterable, List
+from typing import Iterable, List, Sequence, Tuple
 
 __all__ = ["IndentTrimmer"]
 
@@ -10,6 +10,8 @@ __all__ = ["IndentTrimmer"]
 class IndentTrimmer:
     """
     Utility for removing indentation for sections and lines.
+
+    All methods scan text once and slice it, so they are linear to text length.
     """
 
     @staticmethod
@@ -26,13 +28,82 @@ class IndentTrimmer:
         Returns:
             A stripped string.
         """
-        lines = text.split("\n")
-        while lines and not lines[0].strip():
-            lines.pop(0)
-        while lines and not lines[-1].strip():
-            lines.pop()
+        stripped_start = len(text) - len(text.lstrip())
+        if stripped_start == len(text):
+            return ""
+
+        start = text.rfind("\n", 0, stripped_start) + 1
+        end = text.find("\n", len(text.rstrip()))
+        if end < 0:
+            end = len(text)
+
+        return text[start:end]
+
+    @staticmethod
+    def _scan_lines(lines: Sequence[str]) -> Tuple[int, int, int]:
+        """
+        Find non-empty lines span and their minimum indent in a single pass.
+
+        Arguments:
+            lines -- List of lines.
+
+        Returns:
+            A tuple of first non-empty line index, last non-empty line index plus one
+            and minimum indent. `(0, 0, 0)` if all lines are empty.
+        """
+        start = -1
+        end = 0
+        min_indent = 0
+        for index, line in enumerate(lines):
+            stripped_line = line.lstrip()
+            if not stripped_line:
+                continue
+
+            indent = len(line) - len(stripped_line)
+            if start < 0:
+                start = index
+                min_indent = indent
+            elif indent < min_indent:
+                min_indent = indent
+            end = index + 1
+
+        if start < 0:
+            return 0, 0, 0
 
-        return "\n".join(lines)
+        return start, end, min_indent
+
+    @classmethod
+    def trim_block(cls, lines: Iterable[str]) -> List[str]:
+        """
+        Trim empty lines in the beginning and the end and minimum indent from each line.
+
+        Works like `trim_empty_lines` followed by `trim_lines`, but scans lines once.
+
+        Examples::
+
+            IndentTrimmer.trim_block([
+                '',
+                '  asd',
+                '   asd',
+                ' ',
+            ])
+            [
+                'asd',
+                ' asd',
+            ]
+
+        Arguments:
+            lines -- List of lines.
+
+        Returns:
+            A list of lines with trimmed indent.
+        """
+        lines = list(lines)
+        start, end, min_indent = cls._scan_lines(lines)
+        if not min_indent:
+            return lines[start:end]
+
+        return [line[min_indent:] for line in lines[start:end]]
 
     @classmethod
     def trim_text(cls, text: str) -> str:
@@ -78,16 +149,12 @@ class IndentTrimmer:
         Returns:
             A list of lines with trimmed indent.
         """
-        indents = [cls.get_line_indent(line) for line in lines if line.strip()]
-        min_indent = 0
-        if indents:
-            min_indent = min(indents)
-
-        new_lines = []
-        for line in lines:
-            new_lines.append(cls.trim_line(line, min_indent))
+        lines = list(lines)
+        _, _, min_indent = cls._scan_lines(lines)
+        if not min_indent:
+            return lines
 
-        return new_lines
+        return [line[min_indent:] for line in lines]
 
     @staticmethod
     def trim_line(line: str, indent: int) -> str:
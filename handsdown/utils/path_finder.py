@@ -5,12 +5,37 @@ Supports `.gitignore`-like `include` and `exclude` patterns.
 """
 
 import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from handsdown.settings import RELATIVE_PATH_CACHE_SIZE
 
 __all__ = ["PathFinder", "PathFinderError"]
 
 
+@lru_cache(maxsize=RELATIVE_PATH_CACHE_SIZE)
+def _get_relative_path(root: Path, target: Path) -> Path:
+    """
+    Get a relative path from `root` to `target` comparing path parts.
+    """
+    root_parts = root.parts
+    target_parts = target.parts
+    common_count = 0
+    for root_part, target_part in zip(root_parts, target_parts):
+        if os.path.normcase(root_part) != os.path.normcase(target_part):
+            break
+        common_count += 1
+
+    up_parts = [".."] * (len(root_parts) - common_count)
+    if not common_count:
+        return Path(*up_parts)
+
+    return Path(*up_parts, *target_parts[common_count:])
+
+
 class PathFinderError(Exception):
     """
     Main error for `PathFinder`.
@@ -54,8 +79,61 @@ class PathFinder:
             pass
 
         self._root = root
-        self.include_exprs: List[str] = []
-        self.exclude_exprs: List[str] = []
+        self._include_exprs: Tuple[str, ...] = ()
+        self._exclude_exprs: Tuple[str, ...] = ()
+        self._include_re: Optional[Pattern[str]] = None
+        self._exclude_re: Optional[Pattern[str]] = None
+        self._exclude_dir_re: Optional[Pattern[str]] = None
+
+    @staticmethod
+    def _compile_exprs(fn_exprs: Iterable[str]) -> Optional[Pattern[str]]:
+        """
+        Compile `fnmatch` expressions into a single regular expression.
+
+        Arguments:
+            fn_exprs -- `fnmatch` expressions.
+
+        Returns:
+            A compiled pattern that matches if any expression matches or None if there are none.
+        """
+        re_exprs = [fnmatch.translate(os.path.normcase(i)) for i in fn_exprs]
+        if not re_exprs:
+            return None
+
+        return re.compile("|".join(re_exprs))
+
+    @property
+    def include_exprs(self) -> Tuple[str, ...]:
+        """
+        White list `fnmatch` expressions.
+
+        Immutable, so compiled expressions cannot get stale. Assign a new value to change it.
+        """
+        return self._include_exprs
+
+    @include_exprs.setter
+    def include_exprs(self, include_exprs: Iterable[str]) -> None:
+        self._include_exprs = tuple(include_exprs)
+        self._include_re = self._compile_exprs(self._include_exprs)
+
+    @property
+    def exclude_exprs(self) -> Tuple[str, ...]:
+        """
+        Black list `fnmatch` expressions.
+
+        Immutable, so compiled expressions cannot get stale. Assign a new value to change it.
+        """
+        return self._exclude_exprs
+
+    @exclude_exprs.setter
+    def exclude_exprs(self, exclude_exprs: Iterable[str]) -> None:
+        self._exclude_exprs = tuple(exclude_exprs)
+        self._exclude_re = self._compile_exprs(self._exclude_exprs)
+
+        # expression with trailing `*` matches all paths in a directory
+        # if the rest of the expression matches the directory path with a trailing slash
+        dir_exprs = [i.rstrip("*") for i in self._exclude_exprs if i.endswith("*")]
+        self._exclude_dir_re = self._compile_exprs(dir_exprs)
 
     def _copy(self, include_exprs: Iterable[str], exclude_exprs: Iterable[str]) -> "PathFinder":
         new_copy = PathFinder(self._root)
@@ -105,43 +183,82 @@ class PathFinder:
             exclude_exprs.append(fn_exrp)
         return self._copy(include_exprs=self.include_exprs, exclude_exprs=exclude_exprs)
 
-    def _match_include(self, path: Path) -> bool:
-        if not self.include_exprs:
-            return True
-
-        posix_path = path.as_posix()
-        for include_expr in self.include_exprs:
-            if fnmatch.fnmatch(posix_path, include_expr):
-                return True
+    def _match(self, posix_path: str) -> bool:
+        """
+        Check if `posix_path` relative to `root` matches `include` and `exclude` expressions.
+        """
+        posix_path = os.path.normcase(posix_path)
+        if self._include_re and not self._include_re.match(posix_path):
+            return False
+        if self._exclude_re and self._exclude_re.match(posix_path):
+            return False
 
-        return False
+        return True
 
-    def _match_exclude(self, path: Path) -> bool:
-        if not self.exclude_exprs:
+    def _match_exclude_dir(self, posix_path: str) -> bool:
+        """
+        Check if every path inside `posix_path` directory matches an `exclude` expression.
+        """
+        if not self._exclude_dir_re:
             return False
 
-        posix_path = path.as_posix()
-        for exclude_expr in self.exclude_exprs:
-            if fnmatch.fnmatch(posix_path, exclude_expr):
-                return True
+        return bool(self._exclude_dir_re.match(os.path.normcase(f"{posix_path}/")))
 
-        return False
+    def _walk(self, name_expr: str) -> Iterator[Tuple[Path, str]]:
+        """
+        Find paths with names matching `name_expr` in `root` recursively.
+
+        Uses `os.scandir` and does not descend into excluded directories.
+        Symlinks to directories are not followed.
+
+        Arguments:
+            name_expr -- `fnmatch` expression for path name.
+
+        Yields:
+            A tuple of matching path and its POSIX path relative to `root`.
+        """
+        name_re = re.compile(fnmatch.translate(os.path.normcase(name_expr)))
+        stack: List[Tuple[str, str]] = [(str(self._root), "")]
+        while stack:
+            dir_path, dir_posix_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        posix_path = f"{dir_posix_path}{entry.name}"
+                        if name_re.match(os.path.normcase(entry.name)):
+                            yield Path(entry.path), posix_path
+
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+
+                        if is_dir and not self._match_exclude_dir(posix_path):
+                            stack.append((entry.path, f"{posix_path}/"))
+            except OSError:
+                continue
 
     def glob(self, glob_expr: str) -> Iterator[Path]:
         """
         Find all matching `Path` objects respecting `include` and `exclude` patterns.
 
+        Recursive `**/<name>` expressions skip excluded directories without scanning them.
+
         Yields:
             Matching `Path` objects.
         """
-        for path in self._root.glob(glob_expr):
-            relative_path = path.relative_to(self._root)
-            if not self._match_include(relative_path):
-                continue
-            if self._match_exclude(relative_path):
-                continue
-
-            yield path
+        name_expr = glob_expr[3:]
+        if glob_expr.startswith("**/") and name_expr and "/" not in name_expr:
+            matches = self._walk(name_expr)
+        else:
+            matches = (
+                (path, path.relative_to(self._root).as_posix())
+                for path in self._root.glob(glob_expr)
+            )
+
+        for path, posix_path in matches:
+            if self._match(posix_path):
+                yield path
 
     def relative(self, target: Path) -> Path:
         """
@@ -158,19 +275,14 @@ class PathFinder:
         if not target.is_absolute():
             raise PathFinderError("Target path should be absolute")
 
-        relative_target = Path()
-        up_path = Path()
-        parents = [self._root] + list(self._root.parents)
-        for parent in parents:
-            try:
-                relative_target = target.relative_to(parent)
-            except ValueError:
-                up_path = up_path / ".."
-                continue
-            else:
-                break
+        return _get_relative_path(self._root, target)
 
-        return up_path / relative_target
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear memoized relative paths.
+        """
+        _get_relative_path.cache_clear()
 
     def mkdir(self, force: bool = False) -> None:
         """
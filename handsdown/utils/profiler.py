@@ -0,0 +1,217 @@
+"""
+Wall and CPU time profiler for generation stages.
+"""
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from handsdown.utils.logger import get_logger
+
+__all__ = ["Profiler", "ProfileRecord"]
+
+
+class ProfileRecord(NamedTuple):
+    """
+    Single measured stage run.
+
+    Attributes:
+        stage -- Stage name.
+        module -- Module import string or an empty string for project-wide stages.
+        wall -- Wall time in seconds.
+        cpu -- CPU time of the current process in seconds.
+        depth -- Nesting level, `0` for top-level stages.
+    """
+
+    stage: str
+    module: str
+    wall: float
+    cpu: float
+    depth: int
+
+
+class _NullContext:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+
+class Profiler:
+    """
+    Wall and CPU time profiler for generation stages.
+
+    Disabled profiler returns a shared no-op context, so instrumented code
+    pays only for a method call.
+
+    Examples::
+
+        profiler = Profiler(enabled=True)
+        with profiler.stage("render", "my_module"):
+            with profiler.stage("links", "my_module"):
+                replace_links()
+
+        profiler.write(Path("profile.json"))
+        profiler.log_summary()
+
+    Arguments:
+        enabled -- Whether to record stages.
+    """
+
+    # Number of slowest modules in summary
+    TOP_COUNT = 10
+
+    _null_context = _NullContext()
+
+    def __init__(self, enabled: bool = False) -> None:
+        self._logger = get_logger()
+        self.enabled = enabled
+        self.records: List[ProfileRecord] = []
+        self._depth = 0
+
+    def stage(self, name: str, module: str = "") -> ContextManager[None]:
+        """
+        Measure a stage.
+
+        Arguments:
+            name -- Stage name.
+            module -- Module import string.
+
+        Returns:
+            A context manager that records stage time on exit.
+        """
+        if not self.enabled:
+            return self._null_context
+
+        return self._measure(name, module)
+
+    @contextmanager
+    def _measure(self, name: str, module: str) -> Iterator[None]:
+        depth = self._depth
+        self._depth += 1
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.records.append(
+                ProfileRecord(
+                    stage=name,
+                    module=module,
+                    wall=time.perf_counter() - wall_start,
+                    cpu=time.process_time() - cpu_start,
+                    depth=depth,
+                )
+            )
+
+    def pop_records(self) -> List[ProfileRecord]:
+        """
+        Get and clear recorded stages.
+
+        Used to pass records from worker processes to the main one.
+
+        Returns:
+            A list of records.
+        """
+        result = self.records
+        self.records = []
+        return result
+
+    def add_records(self, records: Iterable[ProfileRecord]) -> None:
+        """
+        Add records measured in another process.
+
+        Arguments:
+            records -- Records from `pop_records`.
+        """
+        self.records.extend(records)
+
+    def get_stages(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get total time for each stage.
+
+        Nested stages are included into parent ones.
+
+        Returns:
+            A dictionary with `wall`, `cpu` and `count` values by stage name.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for record in self.records:
+            stage = result.setdefault(record.stage, dict(wall=0.0, cpu=0.0, count=0))
+            stage["wall"] += record.wall
+            stage["cpu"] += record.cpu
+            stage["count"] += 1
+
+        return result
+
+    def get_modules(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get wall time for each stage by module.
+
+        Returns:
+            A dictionary of stage wall times and a top-level stages `total` by module.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for record in self.records:
+            if not record.module:
+                continue
+
+            module = result.setdefault(record.module, dict(total=0.0))
+            module[record.stage] = module.get(record.stage, 0.0) + record.wall
+            if record.depth == 0:
+                module["total"] += record.wall
+
+        return result
+
+    def get_slowest_modules(self, count: int = TOP_COUNT) -> List[Tuple[str, float]]:
+        """
+        Get modules with the highest total wall time.
+
+        Arguments:
+            count -- Maximum number of modules.
+
+        Returns:
+            A list of module import strings and total wall times.
+        """
+        modules = self.get_modules()
+        totals = [(name, module["total"]) for name, module in modules.items()]
+        totals.sort(key=lambda x: (-x[1], x[0]))
+        return totals[:count]
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Get full JSON-serializable report.
+        """
+        return dict(
+            stages=self.get_stages(),
+            modules=self.get_modules(),
+            slowest_modules=[
+                dict(module=name, wall=wall) for name, wall in self.get_slowest_modules()
+            ],
+        )
+
+    def write(self, path: Path) -> None:
+        """
+        Write JSON report to `path`.
+
+        Arguments:
+            path -- Output JSON file path.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.get_report(), indent=2, sort_keys=True))
+
+    def log_summary(self) -> None:
+        """
+        Log stage totals and slowest modules.
+        """
+        for name, stage in self.get_stages().items():
+            self._logger.info(
+                f"Stage {name}: {stage['wall']:.3f}s wall, {stage['cpu']:.3f}s CPU,"
+                f" {stage['count']} runs"
+            )
+
+        for name, wall in self.get_slowest_modules():
+            self._logger.info(f"Slow module {name}: {wall:.3f}s")
@@ -0,0 +1,94 @@
+"""
+Source files watcher that regenerates affected docs on changes.
+"""
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+from handsdown.generator import Generator
+from handsdown.settings import SOURCES_GLOB, WATCH_INTERVAL
+from handsdown.utils.logger import get_logger
+from handsdown.utils.path_finder import PathFinder
+
+__all__ = ["Watcher"]
+
+
+class Watcher:
+    """
+    Source files watcher that regenerates affected docs on changes.
+
+    Polls modification time and size of source files, so it works on any
+    file system without extra dependencies. Loaded modules are kept in
+    `generator` between checks, so only changed files are parsed again.
+
+    Examples::
+
+        generator = Generator(input_path=root, output_path=output, source_paths=paths)
+        generator.generate_docs()
+        Watcher(generator, PathFinder(root)).watch()
+
+    Arguments:
+        generator -- `Generator` with loaded modules.
+        path_finder -- `PathFinder` to find source files.
+        cleanup -- Remove orphaned docs after each update.
+        interval -- Poll interval in seconds.
+    """
+
+    def __init__(
+        self,
+        generator: Generator,
+        path_finder: PathFinder,
+        cleanup: bool = False,
+        interval: float = WATCH_INTERVAL,
+    ) -> None:
+        self._logger = get_logger()
+        self._generator = generator
+        self._path_finder = path_finder
+        self._cleanup = cleanup
+        self._interval = interval
+        self._snapshot = self._get_snapshot()
+
+    def _get_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        result: Dict[Path, Tuple[int, int]] = {}
+        for source_path in self._path_finder.glob(SOURCES_GLOB):
+            try:
+                stat = source_path.stat()
+            except OSError:
+                continue
+            result[source_path] = (stat.st_mtime_ns, stat.st_size)
+
+        return result
+
+    def check(self) -> bool:
+        """
+        Check source files once and update docs if any of them changed.
+
+        Returns:
+            True if source files changed.
+        """
+        snapshot = self._get_snapshot()
+        if snapshot == self._snapshot:
+            return False
+
+        changed_paths = [i for i, stat in snapshot.items() if self._snapshot.get(i) != stat]
+        removed_count = len(self._snapshot.keys() - snapshot.keys())
+        self._snapshot = snapshot
+        self._logger.info(
+            f"Found {len(changed_paths)} changed and {removed_count} removed source files"
+        )
+        self._generator.update(snapshot.keys(), changed_paths)
+        if self._cleanup:
+            self._generator.cleanup_old_docs()
+        return True
+
+    def watch(self) -> None:
+        """
+        Check source files every `interval` seconds until interrupted.
+        """
+        self._logger.info("Watching source files for changes, press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(self._interval)
+                self.check()
+        except KeyboardInterrupt:
+            self._logger.info("Stopped watching")
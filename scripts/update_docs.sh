@@ -4,5 +4,5 @@ set -e
 ROOT_PATH=$(dirname $(dirname $(realpath $0)))
 cd $ROOT_PATH
 
-handsdown -o docs_local --cleanup --branch main $@
-handsdown --external `git config --get remote.origin.url` --cleanup --branch main $@
+handsdown --exclude 'benchmarks/*' -o docs_local --cleanup --branch main $@
+handsdown --exclude 'benchmarks/*' --external `git config --get remote.origin.url` --cleanup --branch main $@
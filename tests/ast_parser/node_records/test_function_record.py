@@ -138,3 +138,14 @@ class TestFunctionRecord(unittest.TestCase):
             record.render(allow_multiline=True),
             "@my_deco\n@classmethod\nasync def name(, ) -> :",
         )
+
+    def test_render_cache(self):
+        node = ast.parse("def func(a, b):  # type: (int, str) -> None\n    pass").body[0]
+        record = FunctionRecord(node, is_method=False)
+        self.assertEqual(record.render(), "def func(a, b):")
+        with patch.object(FunctionRecord, "_render") as render_mock:
+            self.assertEqual(record.render(), "def func(a, b):")
+            render_mock.assert_not_called()
+
+        record.parse_type_comments(["def func(a, b):  # type: (int, str) -> None"])
+        self.assertEqual(record.render(), "def func(a: int, b: str) -> None:")
@@ -17,6 +17,7 @@ class TestFunctionRecord(unittest.TestCase):
         self.assertEqual(record.name, "module")
         self.assertEqual(record.title, "")
         self.assertEqual(record.import_string.value, "")
+        self.assertFalse(hasattr(record, "__dict__"))
 
     @patch("handsdown.ast_parser.node_records.module_record.ast.parse")
     def test_create_from_source(self, parse_mock):
@@ -98,10 +99,7 @@ class TestFunctionRecord(unittest.TestCase):
         record.name = "class_node"
         class_node = MagicMock()
         class_node.name = "ClassNode"
-        method_node = MagicMock()
-        method_node.name = "class_method"
-        method_node.body = ["class_method"]
-        method_node.mock_add_spec(ast.FunctionDef)
+        method_node = ast.parse("def class_method(self):\n    pass").body[0]
         class_node.body = [method_node]
         class_node.decorator_list = []
         class_node.bases = []
@@ -130,7 +128,7 @@ class TestFunctionRecord(unittest.TestCase):
         ModuleAnalyzerMock().attribute_nodes = [attribute_node]
         ModuleAnalyzerMock().import_nodes = [import_node]
         self.assertIsNone(record.build_children())
-        self.assertEqual(record.title, "ClassNode")
+        self.assertTrue(record.children_built)
         self.assertEqual(record.class_records[0].node, class_node)
         self.assertEqual(record.function_records[0].node, function_node)
         self.assertEqual(record.attribute_records[0].node, attribute_node)
@@ -145,10 +143,118 @@ class TestFunctionRecord(unittest.TestCase):
             record.class_records[0].method_records[0].import_string.value,
             "my_module.ClassNode.class_method",
         )
+        self.assertEqual(
+            record.class_records[0].method_records[0].title, "ClassNode().class_method"
+        )
         self.assertEqual(
             record.function_records[0].import_string.value, "my_module.function_node"
         )
 
+    @patch("handsdown.ast_parser.node_records.module_record.ModuleAnalyzer")
+    def test_build_symbols(self, ModuleAnalyzerMock):
+        node = MagicMock()
+        node.body = ["body"]
+        node.mock_add_spec(ast.Module)
+        record = ModuleRecord(node)
+        record.import_string = ImportString("my_module")
+        record.name = "class_node"
+        class_node = MagicMock()
+        class_node.name = "ClassNode"
+        function_node = MagicMock()
+        function_node.name = "function_node"
+        attribute_target = MagicMock()
+        attribute_target.id = "attribute_target"
+        attribute_target.mock_add_spec(ast.Name)
+        attribute_node = MagicMock()
+        attribute_node.targets = [attribute_target]
+        ModuleAnalyzerMock().class_nodes = [class_node]
+        ModuleAnalyzerMock().function_nodes = [function_node]
+        ModuleAnalyzerMock().attribute_nodes = [attribute_node]
+        ModuleAnalyzerMock().all_names = ["ClassNode"]
+        self.assertIsNone(record.build_symbols())
+        self.assertEqual(record.title, "ClassNode")
+        self.assertEqual(record.all_names, ["ClassNode"])
+        self.assertEqual(
+            record.symbol_names, {"ClassNode", "function_node", "attribute_target"}
+        )
+        self.assertEqual(record.class_records, [])
+        self.assertIsNone(record.find_record(ImportString("my_module.other")))
+        self.assertIsNone(record.find_record(ImportString("my")))
+        self.assertFalse(record.children_built)
+
+    def test_strip_bodies(self):
+        source = "\n".join(
+            [
+                "class MyClass:",
+                "    def method(self):",
+                '        """',
+                "        Docstring.",
+                '        """',
+                "        return 1",
+                "",
+                "def my_func(a):  # type: (int) -> None",
+                "    return a",
+            ]
+        )
+        record = ModuleRecord(ast.parse(source))
+        record.import_string = ImportString("my_module")
+        record.source_lines = source.split("\n")
+        record.build_symbols()
+        record.strip_bodies()
+        self.assertEqual(len(record.node.body), 2)
+        self.assertIsInstance(record.node.body[1].body[0], ast.Pass)
+        self.assertEqual(record.node.body[1].body[0].lineno, 9)
+
+        self.assertEqual(
+            record.find_record(ImportString("my_module.MyClass.method")).docstring, "Docstring."
+        )
+        method_record = record.class_records[0].method_records[0]
+        self.assertEqual(len(method_record.node.body), 1)
+        self.assertEqual(method_record.node.body[0].lineno, 3)
+
+        record.parse()
+        self.assertEqual(record.function_records[0].render(), "def my_func(a: int) -> None:")
+
+    def test_release(self):
+        source = "class MyClass:\n    def method(self):\n        pass\n\nMY_CONST = 1"
+        record = ModuleRecord(ast.parse(source))
+        record.import_string = ImportString("my_module")
+        record.source_lines = source.split("\n")
+        record.build_symbols()
+        record.release()
+        self.assertEqual(record.source_lines, [])
+        self.assertEqual(record.class_records, [])
+        self.assertEqual(record.node.body, [])
+        self.assertEqual(
+            record.find_record(ImportString("my_module.MyClass.method")).title,
+            "MyClass().method",
+        )
+        self.assertEqual(
+            record.find_record(ImportString("my_module.MY_CONST")).import_string,
+            ImportString("my_module.MY_CONST"),
+        )
+        self.assertIsNone(record.find_record(ImportString("my_module.other")))
+
+    def test_create_stub(self):
+        source = "class MyClass:\n    def method(self):\n        pass\n\nMY_CONST = 1"
+        record = ModuleRecord(ast.parse(source))
+        record.import_string = ImportString("my_module")
+        record.title = "My Module"
+        record.source_lines = source.split("\n")
+        record.build_symbols()
+        stub = record.create_stub()
+        self.assertEqual(len(record.class_records), 1)
+        self.assertEqual(stub.title, "My Module")
+        self.assertEqual(stub.import_string, ImportString("my_module"))
+        self.assertEqual(stub.source_lines, [])
+        self.assertEqual(stub.class_records, [])
+        self.assertEqual(stub.node.body, [])
+        self.assertEqual(
+            stub.find_record(ImportString("my_module.MyClass.method")).title,
+            "MyClass().method",
+        )
+        self.assertIsNone(stub.find_record(ImportString("my_module.other")))
+
     def test_parse(self):
         node = MagicMock()
         node.name = "name"
@@ -238,3 +344,40 @@ class TestFunctionRecord(unittest.TestCase):
             record.render(allow_multiline=True),
             "import_record\n\nclass_record\n\nfunction_record",
         )
+
+    def test_get_related_import_strings(self):
+        source = "\n".join(
+            [
+                "import os.path",
+                "from typing import List as L",
+                "from my_package import utils",
+                "",
+                "MyType = int",
+                "",
+                "class MyClass:",
+                "    def method(self) -> 'MyClass':",
+                "        pass",
+                "",
+                "def my_func(a: MyClass, b: L, c: utils, d: MyType = os) -> None:",
+                "    pass",
+            ]
+        )
+        record = ModuleRecord(ast.parse(source))
+        record.import_string = ImportString("my_module")
+        record.source_lines = source.split("\n")
+        record.parse()
+        for child_record in record.iter_records():
+            child_record.render()
+        self.assertEqual(
+            record.get_related_import_strings(record.function_records[0]),
+            {
+                ImportString("my_module.MyClass"),
+                ImportString("my_module.MyType"),
+                ImportString("typing.List"),
+                ImportString("my_package.utils"),
+            },
+        )
+        self.assertEqual(
+            record.get_related_import_strings(record.class_records[0].method_records[0]), set()
+        )
+        self.assertEqual(record.get_related_import_strings(record), set())
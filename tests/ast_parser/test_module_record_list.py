@@ -0,0 +1,76 @@
+# pylint: disable=missing-docstring
+import unittest
+from unittest.mock import MagicMock
+
+from handsdown.ast_parser.module_record_list import ModuleRecordList
+from handsdown.utils.import_string import ImportString
+
+
+class TestModuleRecordList(unittest.TestCase):
+    @staticmethod
+    def _create_module_record(import_string):
+        module_record = MagicMock()
+        module_record.import_string = ImportString(import_string)
+        return module_record
+
+    def test_add(self):
+        module_record_list = ModuleRecordList()
+        package = self._create_module_record("package")
+        module = self._create_module_record("package.module")
+        subpackage = self._create_module_record("package.subpackage")
+        submodule = self._create_module_record("package.subpackage.submodule")
+        other = self._create_module_record("other")
+        for module_record in (package, module, subpackage, submodule, other):
+            module_record_list.add(module_record)
+
+        self.assertEqual(list(module_record_list), [package, module, subpackage, submodule, other])
+        self.assertEqual(module_record_list.get_package_names(), {"package", "other"})
+        self.assertEqual(
+            module_record_list.find_module_record(ImportString("package.subpackage.Class")),
+            subpackage,
+        )
+        self.assertIsNone(module_record_list.find_module_record(ImportString("unknown.Class")))
+
+    def test_get_descendants(self):
+        module_record_list = ModuleRecordList()
+        package = self._create_module_record("package")
+        module = self._create_module_record("package.module")
+        subpackage = self._create_module_record("package.subpackage")
+        submodule = self._create_module_record("package.subpackage.submodule")
+        other = self._create_module_record("other")
+        for module_record in (package, module, subpackage, submodule, other):
+            module_record_list.add(module_record)
+
+        self.assertEqual(
+            module_record_list.get_descendants(ImportString("package")),
+            [module, subpackage, submodule],
+        )
+        self.assertEqual(
+            module_record_list.get_descendants(ImportString("package.subpackage")), [submodule]
+        )
+        self.assertEqual(module_record_list.get_descendants(ImportString("other")), [])
+        self.assertEqual(
+            module_record_list.get_descendants(ImportString("")),
+            [package, module, subpackage, submodule, other],
+        )
+
+    def test_replace(self):
+        module_record_list = ModuleRecordList()
+        package = self._create_module_record("package")
+        submodule = self._create_module_record("package.subpackage.submodule")
+        for module_record in (package, submodule):
+            module_record_list.add(module_record)
+
+        new_submodule = self._create_module_record("package.subpackage.submodule")
+        self.assertIs(module_record_list.replace(new_submodule), submodule)
+        self.assertEqual(list(module_record_list), [package, new_submodule])
+        self.assertEqual(
+            module_record_list.get_descendants(ImportString("package.subpackage")), [new_submodule]
+        )
+        self.assertIs(
+            module_record_list.find_module_record(ImportString("package.subpackage.submodule")),
+            new_submodule,
+        )
+
+        with self.assertRaises(KeyError):
+            module_record_list.replace(self._create_module_record("other"))
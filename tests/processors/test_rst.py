@@ -0,0 +1,45 @@
+# pylint: disable=missing-docstring
+import re
+import unittest
+
+from handsdown.processors.rst import RSTDocstringProcessor
+
+
+class TestRSTDocstringProcessor(unittest.TestCase):
+    def test_line_re_dispatch(self):
+        processor = RSTDocstringProcessor()
+        self.assertEqual(processor._line_re_fallback, ())
+        self.assertEqual(list(processor._line_re_dispatch), [":"])
+        self.assertEqual(processor._line_re_dispatch[":"], processor.line_re_map)
+        self.assertEqual(processor._get_first_char(re.compile(r"^\s*test")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"a?b")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"a", re.I)), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"^\.\. ")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"^-+")), "-")
+        self.assertEqual(processor._get_first_char(re.compile(r"a|b")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"^ab|^c")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"(a|b)c")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"[ab]c")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"a b", re.X)), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"a(b|c)")), "a")
+        self.assertEqual(processor._get_first_char(re.compile(r"a[|)]\|b")), "a")
+        self.assertEqual(processor._get_first_char(re.compile(r"a[](]|b")), None)
+        self.assertEqual(processor._get_first_char(re.compile(r"a[^](]b")), "a")
+        self.assertEqual(processor._get_first_char(re.compile(r"a[\]]|b")), None)
+
+    def test_build_sections(self):
+        processor = RSTDocstringProcessor()
+        sections = processor.build_sections(
+            "Summary with :class:`~my.Class`.\n\n"
+            ":param arg: Description\n"
+            ":type arg: str\n"
+            ":returns: Result\n"
+            ":raises ValueError: Error\n"
+            "Text: with colon\n"
+        )
+        self.assertEqual(sections[""].render(), "Summary with class `my.Class`.\n\n")
+        self.assertEqual(sections["Arguments"].render(), "- `arg` - Description\n:type arg: str")
+        self.assertEqual(sections["Returns"].render(), "Result")
+        self.assertEqual(
+            sections["Raises"].render(), "- `ValueError` -  Error\nText: with colon\n\n"
+        )
@@ -0,0 +1,83 @@
+# pylint: disable=missing-docstring
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from handsdown.processors.section_map import SectionMap
+from handsdown.processors.section_map_cache import SectionMapCache
+from handsdown.utils import get_hash, get_version
+
+
+class TestSectionMapCache(unittest.TestCase):
+    def setUp(self):
+        self.section_map = SectionMap()
+        self.section_map.add_line("", "Summary")
+        self.section_map.add_line("Arguments", "- `arg` - Description")
+
+    def test_get(self):
+        cache = SectionMapCache(max_size=2)
+        self.assertIsNone(cache.get("Processor", "doc"))
+
+        # unique docstrings are not stored
+        cache.set("Processor", "doc", self.section_map)
+        self.assertIsNone(cache.get("Processor", "doc"))
+        cache.set("Processor", "doc", self.section_map)
+        result = cache.get("Processor", "doc")
+        self.assertIsNot(result, self.section_map)
+        self.assertEqual(result["Arguments"].render(), "- `arg` - Description")
+        self.assertIsNone(cache.get("Other", "doc"))
+
+        result.add_line("Arguments", "- `new` - Description")
+        self.assertEqual(
+            cache.get("Processor", "doc")["Arguments"].render(), "- `arg` - Description"
+        )
+
+        cache.set("Processor", "doc2", self.section_map)
+        cache.set("Processor", "doc3", self.section_map)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("Processor", "doc"))
+
+    def test_new_entries(self):
+        cache = SectionMapCache()
+        cache.set("Processor", "doc", self.section_map)
+        cache.set("Processor", "doc", self.section_map)
+        entries = cache.pop_new_entries()
+        self.assertEqual(list(entries), [get_hash("Processor", "doc")])
+        self.assertEqual(cache.pop_new_entries(), {})
+
+        new_cache = SectionMapCache()
+        new_cache.add_entries(entries)
+        self.assertEqual(new_cache.get("Processor", "doc")[""].render(), "Summary")
+
+    def test_save(self):
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache" / "section_maps.json"
+            cache = SectionMapCache(path)
+            cache.set("Processor", "doc", self.section_map)
+            cache.set("Processor", "doc", self.section_map)
+            cache.set("Processor", "unique", self.section_map)
+            cache.save()
+
+            new_cache = SectionMapCache(path)
+            new_cache.load()
+            self.assertEqual(len(new_cache), 1)
+            self.assertEqual(new_cache.get("Processor", "doc")[""].render(), "Summary")
+
+            self.assertNotIn("doc", path.read_text())
+
+            path.write_bytes(b"broken")
+            broken_cache = SectionMapCache(path)
+            broken_cache.load()
+            self.assertEqual(len(broken_cache), 0)
+
+            data = dict(version=1, handsdown=get_version(), entries={"key": [["title", "line"]]})
+            path.write_text(json.dumps(data))
+            broken_cache = SectionMapCache(path)
+            broken_cache.load()
+            self.assertEqual(len(broken_cache), 0)
+
+        missing_cache = SectionMapCache(Path("/non/existing.json"))
+        missing_cache.load()
+        self.assertEqual(len(missing_cache), 0)
+        SectionMapCache().save()
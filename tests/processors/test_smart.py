@@ -0,0 +1,79 @@
+# pylint: disable=missing-docstring
+import unittest
+from unittest.mock import patch
+
+from handsdown.processors.pep257 import PEP257DocstringProcessor
+from handsdown.processors.rst import RSTDocstringProcessor
+from handsdown.processors.section_map_cache import SectionMapCache
+from handsdown.processors.smart import SmartDocstringProcessor
+
+
+class TestSmartDocstringProcessor(unittest.TestCase):
+    def test_build_sections(self):
+        processor = SmartDocstringProcessor()
+        sections = processor.build_sections("Summary.\n\nArguments:\n    arg -- Description\n")
+        self.assertEqual(sections["Arguments"].render(), "- `arg` - Description\n\n")
+        sections = processor.build_sections("Summary.\n\n:param arg: Description\n")
+        self.assertEqual(sections["Arguments"].render(), "- `arg` - Description\n\n")
+        sections = processor.build_sections("Summary: Arguments:\n")
+        self.assertEqual(sections[""].render(), "Summary: Arguments:\n\n")
+        self.assertEqual(processor.get_settings_key(), "SmartDocstringProcessor:0")
+
+    @patch.object(PEP257DocstringProcessor, "build_sections")
+    @patch.object(RSTDocstringProcessor, "build_sections")
+    def test_lock_after(self, rst_mock, pep257_mock):
+        processor = SmartDocstringProcessor(lock_after=2)
+        pep257_docstring = "Arguments:\n    arg -- Description"
+        rst_docstring = ":param arg: Description"
+
+        processor.build_sections(pep257_docstring)
+        processor.build_sections("Summary.")
+        processor.build_sections(rst_docstring)
+        processor.build_sections(pep257_docstring)
+        processor.build_sections(pep257_docstring)
+        self.assertEqual(pep257_mock.call_count, 3)
+        self.assertEqual(rst_mock.call_count, 2)
+
+        processor.build_sections("Summary.")
+        self.assertEqual(pep257_mock.call_count, 4)
+        self.assertEqual(rst_mock.call_count, 2)
+
+        processor.build_sections(rst_docstring)
+        processor.build_sections("Summary.")
+        self.assertEqual(pep257_mock.call_count, 4)
+        self.assertEqual(rst_mock.call_count, 4)
+
+        processor.build_sections(pep257_docstring)
+        processor.build_sections(pep257_docstring)
+        processor.build_sections(".. note:: Description")
+        self.assertEqual(pep257_mock.call_count, 6)
+        self.assertEqual(rst_mock.call_count, 5)
+
+        processor.build_sections(pep257_docstring)
+        processor.build_sections(pep257_docstring)
+        processor.reset_style()
+        processor.build_sections("Summary.")
+        self.assertEqual(rst_mock.call_count, 6)
+        self.assertEqual(processor.get_settings_key(), "SmartDocstringProcessor:2")
+
+    def test_lock_after_rst_directive(self):
+        processor = SmartDocstringProcessor(lock_after=2)
+        for _ in range(2):
+            processor.build_sections("Arguments:\n    arg -- Description")
+        sections = processor.build_sections("Summary.\n\n.. note:: RST note.")
+        self.assertEqual(sections["Notes"].render(), "RST note.")
+
+    def test_section_map_cache(self):
+        processor = SmartDocstringProcessor()
+        processor.set_section_map_cache(SectionMapCache())
+        docstring = "Summary.\n\nArguments:\n    arg -- Description\n"
+        with patch.object(
+            PEP257DocstringProcessor,
+            "_build_sections",
+            wraps=processor._pep257_processor._build_sections,
+        ) as build_sections_mock:
+            for _ in range(3):
+                sections = processor.build_sections(docstring)
+                self.assertEqual(sections["Arguments"].render(), "- `arg` - Description\n\n")
+
+        self.assertEqual(build_sections_mock.call_count, 2)
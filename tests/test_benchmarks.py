@@ -0,0 +1,33 @@
+# pylint: disable=missing-docstring
+import unittest
+
+from benchmarks.harness import STAGES, run_benchmark
+from benchmarks.project_generator import ProjectGenerator, ProjectSettings
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_project_generator(self):
+        generator = ProjectGenerator(ProjectSettings(modules=3, modules_per_package=2, links=1))
+        self.assertEqual(
+            [i.as_posix() for i in generator.iter_files()],
+            [
+                "synthetic/__init__.py",
+                "synthetic/package_000/__init__.py",
+                "synthetic/package_001/__init__.py",
+                "synthetic/package_000/module_0000.py",
+                "synthetic/package_000/module_0001.py",
+                "synthetic/package_001/module_0002.py",
+            ],
+        )
+        source = generator.render_module(0)
+        compile(source, "module_0000.py", "exec")
+        self.assertIn("class Module0000:", source)
+
+        with self.assertRaises(ValueError):
+            ProjectGenerator(ProjectSettings(styles=("unknown",)))
+
+    def test_run_benchmark(self):
+        result = run_benchmark(ProjectSettings(modules=2, classes=1, methods=1), repeat=1)
+        self.assertEqual(list(result["stages"]), list(STAGES))
+        self.assertEqual(result["files"], 4)
+        self.assertEqual(result["project"]["modules"], 2)
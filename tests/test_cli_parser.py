@@ -2,6 +2,7 @@
 import argparse
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from handsdown.cli_parser import (
     CLINamespace,
@@ -10,6 +11,7 @@ from handsdown.cli_parser import (
     existing_dir_abs_path,
     git_repo,
     parse_args,
+    positive_int,
 )
 
 
@@ -49,9 +51,28 @@ class TestCLIParser(unittest.TestCase):
         with self.assertRaises(argparse.ArgumentTypeError):
             existing_dir_abs_path(Path(__file__).as_posix())
 
+    def test_positive_int(self):
+        self.assertEqual(positive_int("4"), 4)
+
+        with self.assertRaises(argparse.ArgumentTypeError):
+            positive_int("0")
+
+        with self.assertRaises(argparse.ArgumentTypeError):
+            positive_int("many")
+
     def test_parse_args(self):
         self.assertIsInstance(parse_args([]), CLINamespace)
 
+    @patch("sys.stderr")
+    def test_parse_args_errors(self, _stderr_mock):
+        with self.assertRaises(SystemExit):
+            parse_args(["--watch", "--low-memory"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--incremental", "--no-cache"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--lock-style", "3", "--jobs", "2"])
+        self.assertTrue(parse_args(["--incremental"]).incremental)
+
     def test_get_source_code_url(self):
         namespace = parse_args([])
         assert namespace.get_source_code_url() == ""
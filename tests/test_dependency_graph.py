@@ -0,0 +1,49 @@
+# pylint: disable=missing-docstring
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from handsdown.dependency_graph import DependencyGraph, DocDependencies
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def test_is_outdated(self):
+        fingerprints = {"a": "1", "b": "2", "c": "3"}
+        tree_fingerprints = {"a": "t1", "b": "t2", "c": "t3"}
+        graph = DependencyGraph(Path("graph.json"))
+        self.assertTrue(graph.is_outdated("a", fingerprints, tree_fingerprints))
+
+        graph.add("a", DocDependencies(["a", "b"], ["c"]), fingerprints, tree_fingerprints)
+        self.assertEqual(graph.nodes["a"], dict(source="1", links={"b": "2"}, tree={"c": "t3"}))
+        self.assertFalse(graph.is_outdated("a", fingerprints, tree_fingerprints))
+        self.assertTrue(graph.is_outdated("a", dict(fingerprints, a="0"), tree_fingerprints))
+        self.assertTrue(graph.is_outdated("a", dict(fingerprints, b="0"), tree_fingerprints))
+        self.assertFalse(graph.is_outdated("a", dict(fingerprints, c="0"), tree_fingerprints))
+        self.assertTrue(graph.is_outdated("a", fingerprints, dict(tree_fingerprints, c="0")))
+        self.assertTrue(graph.is_outdated("a", {"a": "1"}, tree_fingerprints))
+
+        graph.remove("a")
+        graph.remove("a")
+        self.assertTrue(graph.is_outdated("a", fingerprints, tree_fingerprints))
+
+    def test_load_save(self):
+        fingerprints = {"a": "1"}
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache" / "graph.json"
+            graph = DependencyGraph(path)
+            graph.load("settings")
+            self.assertEqual(graph.nodes, {})
+
+            graph.add("a", DocDependencies([], []), fingerprints, {})
+            graph.save()
+
+            graph = DependencyGraph(path)
+            graph.load("settings")
+            self.assertFalse(graph.is_outdated("a", fingerprints, {}))
+
+            graph.load("new_settings")
+            self.assertEqual(graph.nodes, {})
+
+            path.write_text("broken")
+            graph.load("settings")
+            self.assertEqual(graph.nodes, {})
@@ -1,13 +1,50 @@
 # pylint: disable=missing-docstring
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 from handsdown.generator import Generator, GeneratorError
+from handsdown.md_document import MDDocument
 from handsdown.utils.import_string import ImportString
 
 
 class TestGenerator(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.root_path = Path(self.temp_dir.name)
+        self.package_path = self.root_path / "my_package"
+        self.package_path.mkdir()
+        self.output_path = self.root_path / "docs"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_package(self, **sources):
+        sources = {
+            "__init__": "",
+            "my_class": 'class MyClass:\n    """\n    See `my_package.utils.Utils`.\n    """\n',
+            "utils": "class Utils:\n    pass\n",
+            **sources,
+        }
+        for name, source in sources.items():
+            (self.package_path / f"{name}.py").write_text(source)
+        return sorted(self.package_path.glob("*.py"))
+
+    def _create_generator(self, source_paths, output_path=None, **kwargs):
+        return Generator(
+            input_path=self.root_path,
+            output_path=output_path or self.output_path,
+            source_paths=source_paths,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _get_written_docs(generator, method, *args):
+        with patch.object(generator, "_write_doc", wraps=generator._write_doc) as write_doc_mock:
+            method(*args)
+        return sorted(i.args[0].import_string.value for i in write_doc_mock.call_args_list)
+
     @patch("handsdown.generator.Loader")
     @patch("handsdown.generator.ModuleRecordList")
     @patch("handsdown.generator.MDDocument")
@@ -22,7 +59,7 @@ class TestGenerator(unittest.TestCase):
         )
         self.assertIsInstance(generator, Generator)
         LoaderMock.assert_called_with(
-            output_path=Path("/output"), root_path=Path("/input"), encoding="utf-8"
+            output_path=Path("/output"), root_path=Path("/input"), encoding="utf-8", cache=None
         )
         ModuleRecordListMock.assert_called_with()
         ModuleRecordListMock().add.assert_called_with(LoaderMock().get_module_record())
@@ -45,17 +82,21 @@ class TestGenerator(unittest.TestCase):
         MDDocumentMock().render_md_doc_link.return_value = "md_doc_link"
         MDDocumentMock().render_doc_link.return_value = "doc_link"
         MDDocumentMock().path_finder.relative.return_value = Path('test')
+        MDDocumentMock().title = "Doc title"
 
         module_record_mock = MagicMock()
         module_record_mock.title = "Title"
         module_record_mock.docstring = "Docstring"
+        module_record_mock.source_lines = ["line"]
         module_record_mock.import_string = ImportString("my.import.string")
-        ModuleRecordListMock().__iter__ = MagicMock(return_value=iter([module_record_mock]))
+        ModuleRecordListMock().__iter__ = MagicMock(side_effect=lambda: iter([module_record_mock]))
+        ModuleRecordListMock().find_module_record.return_value = None
 
         generator.generate_docs()
+        MDDocumentMock().write.assert_called_with()
 
         LoaderMock.assert_called_with(
-            output_path=Path("/output"), root_path=Path("/input"), encoding="utf-8"
+            output_path=Path("/output"), root_path=Path("/input"), encoding="utf-8", cache=None
         )
         PathFinderMock.assert_called_with(Path("/output"))
 
@@ -96,7 +137,7 @@ class TestGenerator(unittest.TestCase):
         generator.generate_doc(Path("/input/source2.py"))
 
         LoaderMock.assert_called_with(
-            output_path=Path("/output"), root_path=Path("/input"), encoding="utf-8"
+            output_path=Path("/output"), root_path=Path("/input"), encoding="utf-8", cache=None
         )
         PathFinderMock.assert_called_with(Path("/output"))
 
@@ -131,3 +172,148 @@ class TestGenerator(unittest.TestCase):
         PathFinderMock.assert_called_with(Path("/output"))
         PathFinderMock().glob.assert_called_with("**/*.md")
         doc_path_mock.unlink.assert_called_with()
+
+    def test_jobs(self):
+        source_paths = self._write_package(
+            my_class='class MyClass:\n    """\n    See `my_package.utils.Utils.run`.\n    """\n',
+            broken="def broken(:\n",
+            utils="class Utils:\n    def run(self, a: int) -> None:\n        pass\n",
+        )
+
+        records = {}
+        docs = {}
+        for jobs in (1, 2):
+            output_path = self.root_path / f"docs{jobs}"
+            generator = self._create_generator(source_paths, output_path=output_path, jobs=jobs)
+            generator.generate_docs()
+            records[jobs] = [(i.import_string.value, i.title) for i in generator._module_records]
+            docs[jobs] = {
+                i.relative_to(output_path): i.read_text() for i in output_path.glob("**/*.md")
+            }
+
+        self.assertEqual(records[1], records[2])
+        self.assertEqual(
+            records[2],
+            [
+                ("my_package", "My Package"),
+                ("my_package.my_class", "MyClass"),
+                ("my_package.utils", "Utils"),
+            ],
+        )
+        self.assertEqual(docs[1], docs[2])
+        self.assertIn("(utils.md#utilsrun)", docs[2][Path("my_package/my_class.md")])
+
+        snapshot = generator.create_worker_snapshot()
+        stubs = list(snapshot._module_records)
+        self.assertEqual([(i.import_string.value, i.title) for i in stubs], records[2])
+        self.assertTrue(all(i.node.body == [] for i in stubs))
+
+    def test_replace_links(self):
+        source_paths = self._write_package(
+            utils="class Utils:\n    def run(self):\n        pass\n\n"
+            "    def stop(self):\n        pass\n",
+            my_class="class MyClass:\n    pass\n",
+        )
+        generator = self._create_generator(source_paths)
+        module_record = generator._module_records.find_module_record(
+            ImportString("my_package.utils")
+        )
+        generator._loader.parse_module_record(module_record)
+        record = module_record.find_record(ImportString("my_package.utils.Utils.stop"))
+        md_document = MDDocument(self.output_path / "my_package" / "utils.md")
+        with patch.object(
+            generator, "_find_module_record", wraps=generator._find_module_record
+        ) as find_module_record_mock:
+            result = generator._replace_links(
+                module_record,
+                record,
+                md_document,
+                "Use `run`, `stop`, `Utils`, ``run``, `my_package.my_class.MyClass`,"
+                " `unknown` and `run`.",
+            )
+            generator._replace_links(module_record, record, md_document, "`unknown`")
+
+        self.assertEqual(
+            result,
+            "Use [Utils().run](#utilsrun), `stop`, [Utils](#utils), [Utils().run](#utilsrun),"
+            " [MyClass](my_class.md#myclass), `unknown` and [Utils().run](#utilsrun).",
+        )
+        self.assertEqual(find_module_record_mock.call_count, 3)
+
+    @patch("handsdown.utils.file_cache.get_secret_key", return_value=b"0" * 32)
+    def test_incremental(self, _get_secret_key_mock):
+        source_paths = self._write_package(other="def other():\n    pass\n")
+
+        def generate_docs():
+            generator = self._create_generator(
+                source_paths, cache_path=self.root_path / "cache", incremental=True
+            )
+            return self._get_written_docs(generator, generator.generate_docs)
+
+        self.assertEqual(
+            generate_docs(),
+            ["my_package", "my_package.my_class", "my_package.other", "my_package.utils"],
+        )
+        self.assertEqual(generate_docs(), [])
+
+        (self.package_path / "utils.py").write_text("class Utils:\n    x = 1\n")
+        self.assertEqual(generate_docs(), ["my_package.my_class", "my_package.utils"])
+
+        (self.output_path / "my_package" / "other.md").unlink()
+        self.assertEqual(generate_docs(), ["my_package.other"])
+
+        (self.package_path / "utils.py").write_text('"""\n# Utilities\n"""\n')
+        self.assertEqual(generate_docs(), ["my_package", "my_package.my_class", "my_package.utils"])
+
+        with self.assertRaises(GeneratorError):
+            Generator(
+                input_path=Path("/"), output_path=Path("/"), source_paths=[], incremental=True
+            )
+
+    def test_update(self):
+        source_paths = self._write_package(other="def other():\n    pass\n")
+        generator = self._create_generator(source_paths)
+        generator.generate_docs()
+        utils_path = self.package_path / "utils.py"
+
+        utils_path.write_text('class Utils:\n    """\n    Updated docstring.\n    """\n')
+        self.assertEqual(
+            self._get_written_docs(generator, generator.update, source_paths, [utils_path]),
+            ["my_package.my_class", "my_package.utils"],
+        )
+        self.assertIn(
+            "Updated docstring.", (self.output_path / "my_package" / "utils.md").read_text()
+        )
+
+        utils_path.write_text('"""\n# Utilities\n"""\n')
+        new_path = self.package_path / "new.py"
+        new_path.write_text("def new():\n    pass\n")
+        self.assertEqual(
+            self._get_written_docs(
+                generator, generator.update, [*source_paths, new_path], [utils_path, new_path]
+            ),
+            [
+                "my_package",
+                "my_package.my_class",
+                "my_package.new",
+                "my_package.other",
+                "my_package.utils",
+            ],
+        )
+        self.assertIn("Utilities", (self.output_path / "my_package" / "utils.md").read_text())
+        self.assertIn("Utilities", (self.output_path / "MODULES.md").read_text())
+
+    def test_low_memory(self):
+        source_paths = self._write_package()
+        generator = self._create_generator(source_paths, low_memory=True)
+        generator.generate_docs()
+        self.assertIn(
+            "[Utils](utils.md#utils)",
+            (self.output_path / "my_package" / "my_class.md").read_text(),
+        )
+        for module_record in generator._module_records:
+            self.assertEqual(module_record.source_lines, [])
+            self.assertEqual(module_record.class_records, [])
+
+        with self.assertRaises(GeneratorError):
+            generator.update(source_paths, [])
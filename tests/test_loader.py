@@ -1,11 +1,73 @@
 # pylint: disable=missing-docstring
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from handsdown.loader import Loader
+from handsdown.utils.file_cache import FileCache
 
 
 class TestLoader(unittest.TestCase):
     def test_init(self):
         loader = Loader(root_path=Path.cwd(), output_path=Path.cwd() / "docs")
         self.assertIsInstance(loader, Loader)
+
+    def test_get_output_path(self):
+        loader = Loader(root_path=Path("/root"), output_path=Path("/root/docs"))
+        self.assertEqual(
+            loader.get_output_path(Path("/root/my_module/utils.py")),
+            Path("/root/docs/my_module/utils.md"),
+        )
+        self.assertEqual(
+            loader.get_output_path(Path("/root/my_module/__init__.py")),
+            Path("/root/docs/my_module/index.md"),
+        )
+        self.assertEqual(
+            loader.get_output_path(Path("/root/__main__.py")), Path("/root/docs/module.md")
+        )
+        with patch.object(loader, "_get_output_path") as get_output_path_mock:
+            loader.get_output_path(Path("/root/my_module/utils.py"))
+            get_output_path_mock.assert_not_called()
+
+            loader.clear_cache()
+            loader.get_output_path(Path("/root/my_module/utils.py"))
+            get_output_path_mock.assert_called_once_with(Path("/root/my_module/utils.py"))
+
+    def test_get_module_record_cache(self):
+        with TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            (root_path / "my_module").mkdir()
+            (root_path / "my_module" / "__init__.py").write_text("")
+            source_path = root_path / "my_module" / "utils.py"
+            source_path.write_text('"""\n# Utils title\n"""\n\nclass Utils:\n    pass\n')
+            cache = FileCache(root_path / ".cache", secret_key=b"0" * 32)
+            loader = Loader(root_path=root_path, output_path=root_path / "docs", cache=cache)
+
+            module_record = loader.get_module_record(source_path)
+            self.assertEqual(module_record.title, "Utils title")
+            self.assertEqual(len(list(cache.path.iterdir())), 1)
+
+            with patch("handsdown.loader.ModuleRecord.create_from_content") as create_mock:
+                cached_module_record = loader.get_module_record(source_path)
+                create_mock.assert_not_called()
+
+            self.assertIsNot(cached_module_record, module_record)
+            self.assertEqual(cached_module_record.title, "Utils title")
+            self.assertEqual(cached_module_record.source_path, source_path)
+            self.assertEqual(cached_module_record.symbol_names, {"Utils"})
+            self.assertTrue(cached_module_record.children_built)
+            self.assertTrue(cached_module_record.parsed)
+            with patch(
+                "handsdown.ast_parser.node_records.module_record.ModuleAnalyzer"
+            ) as analyzer_mock:
+                loader.parse_module_record(cached_module_record)
+                analyzer_mock.assert_not_called()
+            self.assertEqual(
+                cached_module_record.class_records[0].import_string.value, "my_module.utils.Utils"
+            )
+
+            source_path.write_text("class Utils:\n    pass\n")
+            module_record = loader.get_module_record(source_path)
+            self.assertEqual(module_record.title, "Utils")
+            self.assertEqual(len(list(cache.path.iterdir())), 2)
@@ -1,7 +1,7 @@
 # pylint: disable=missing-docstring
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from handsdown.main import main
 
@@ -39,7 +39,14 @@ class TestMain(unittest.TestCase):
             raise_errors=False,
             source_code_url="",
             source_code_path=Path(),
-            source_paths=path_finder_mock().exclude().include().glob(),
+            source_paths=[],
             toc_depth=1,
             encoding="utf-8",
+            jobs=1,
+            cache_path=Path("/.handsdown_cache"),
+            incremental=False,
+            profiler=ANY,
+            stream=False,
+            low_memory=False,
+            docstring_processor=ANY,
         )
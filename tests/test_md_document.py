@@ -1,7 +1,8 @@
 # pylint: disable=missing-docstring
+import os
 import unittest
 from unittest.mock import MagicMock, patch
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 from pathlib import Path
 
 from handsdown.md_document import MDDocument
@@ -76,6 +77,22 @@ class TestMDDocument(unittest.TestCase):
             with MDDocument(Path(temp_f.name)):
                 raise ValueError("test")
 
+    def test_write(self):
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "docs" / "test.md"
+            md_doc = MDDocument(path)
+            md_doc.title = "test"
+            self.assertTrue(md_doc.write())
+            self.assertEqual(path.read_text(), "# test\n")
+
+            os.utime(path, (0, 0))
+            self.assertFalse(md_doc.write())
+            self.assertEqual(path.stat().st_mtime, 0)
+
+            md_doc.title = "tset"
+            self.assertTrue(md_doc.write())
+            self.assertEqual(path.read_text(), "# tset\n")
+
     def test_add_toc_if_not_exists(self):
         with NamedTemporaryFile(mode="w+") as temp_f:
             temp_f.write(
@@ -116,6 +133,18 @@ class TestMDDocument(unittest.TestCase):
         self.assertEqual(md_doc.subtitle, "subtitle")
         self.assertEqual(md_doc.sections[0], "test")
 
+    def test_content(self):
+        md_doc = MDDocument(Path("/test.md"))
+        self.assertEqual(md_doc.content, "\n")
+        md_doc.append("subtitle")
+        md_doc.append_title("header", level=2)
+        md_doc.title = "title"
+        md_doc.toc_section = "- [header](#header)"
+        self.assertEqual(
+            md_doc.content,
+            "# title\n\nsubtitle\n\n- [header](#header)\n\n## header\n",
+        )
+
     def test_append_title(self):
         md_doc = MDDocument(Path("/test.md"))
         md_doc.append_title("title", level=1)
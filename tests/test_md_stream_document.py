@@ -0,0 +1,63 @@
+# pylint: disable=missing-docstring
+import os
+import unittest
+from pathlib import Path
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+
+from handsdown.md_document import MDDocument
+from handsdown.md_stream_document import MDStreamDocument
+
+
+class TestMDStreamDocument(unittest.TestCase):
+    def test_write(self):
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "docs" / "test.md"
+            md_doc = MDStreamDocument(path)
+            md_doc.append("subtitle")
+            md_doc.append("text")
+            md_doc.append_title("header", level=2)
+            md_doc.append("text\n## no header")
+            md_doc.title = "title"
+            md_doc.add_toc_if_not_exists()
+            expected = MDDocument(path)
+            expected.append("subtitle")
+            expected.append("text")
+            expected.append_title("header", level=2)
+            expected.append("text\n## no header")
+            expected.title = "title"
+            expected.add_toc_if_not_exists()
+
+            self.assertEqual(md_doc.toc_section, expected.toc_section)
+            self.assertEqual(md_doc.sections, expected.sections)
+            self.assertEqual(md_doc.content, expected.content)
+            self.assertTrue(md_doc.write())
+            self.assertEqual(path.read_text(), expected.content)
+
+            os.utime(path, (0, 0))
+            self.assertFalse(md_doc.write())
+            self.assertEqual(path.stat().st_mtime, 0)
+            self.assertEqual(os.listdir(path.parent), ["test.md"])
+
+            md_doc.close()
+            self.assertEqual(md_doc.sections, [])
+
+    def test_read(self):
+        with NamedTemporaryFile(mode="w+") as temp_f:
+            temp_f.write("# title\n\nsubtitle\n\n## header\n\ntext\n")
+            temp_f.flush()
+            md_doc = MDStreamDocument(Path(temp_f.name))
+            md_doc.read()
+            self.assertEqual(md_doc.subtitle, "subtitle")
+            self.assertEqual(md_doc.sections, ["## header", "text"])
+            self.assertFalse(md_doc.write())
+            md_doc.close()
+
+    def test_context_manager(self):
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "test.md"
+            with MDStreamDocument(path) as md_doc:
+                md_doc.title = "test"
+                md_doc.append_title("header", level=2)
+
+            self.assertEqual(path.read_text(), "# test\n\n## header\n")
+            self.assertEqual(md_doc.sections, [])
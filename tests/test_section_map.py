@@ -40,3 +40,18 @@ class TestSectionMap(unittest.TestCase):
         self.assertNotIn("section4", section_map)
 
         self.assertEqual(len(list(section_map.sections)), 2)
+
+    def test_tuple(self):
+        section_map = SectionMap()
+        section_map.add_line("section", "one")
+        section_map.add_block("section")
+        section_map.add_line("section", "two")
+        section_map.add_line("", "three")
+        data = section_map.to_tuple()
+        self.assertEqual(data, (("section", (("one",), ("two",))), ("", (("three",),))))
+
+        new_section_map = SectionMap.from_tuple(data)
+        self.assertEqual([i.title for i in new_section_map.sections], ["section", ""])
+        self.assertEqual(new_section_map["section"].render(), "one\n\ntwo")
+        new_section_map.add_line("section", "four")
+        self.assertEqual(SectionMap.from_tuple(data)["section"].render(), "one\n\ntwo")
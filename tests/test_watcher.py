@@ -0,0 +1,47 @@
+# pylint: disable=missing-docstring
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from handsdown.utils.path_finder import PathFinder
+from handsdown.watcher import Watcher
+
+
+class TestWatcher(unittest.TestCase):
+    def test_check(self):
+        with TemporaryDirectory() as temp_dir:
+            root_path = Path(temp_dir)
+            (root_path / "module.py").write_text("a = 1\n")
+            (root_path / "other.py").write_text("b = 1\n")
+            generator = MagicMock()
+            watcher = Watcher(generator, PathFinder(root_path), cleanup=True)
+            self.assertFalse(watcher.check())
+            generator.update.assert_not_called()
+
+            (root_path / "module.py").write_text("a = 22\n")
+            (root_path / "new.py").write_text("c = 1\n")
+            self.assertTrue(watcher.check())
+            source_paths, changed_paths = generator.update.call_args[0]
+            self.assertEqual(
+                sorted(source_paths),
+                [root_path / "module.py", root_path / "new.py", root_path / "other.py"],
+            )
+            self.assertEqual(sorted(changed_paths), [root_path / "module.py", root_path / "new.py"])
+            generator.cleanup_old_docs.assert_called_once_with()
+            self.assertFalse(watcher.check())
+
+            os.remove(root_path / "other.py")
+            self.assertTrue(watcher.check())
+            source_paths, changed_paths = generator.update.call_args[0]
+            self.assertEqual(sorted(source_paths), [root_path / "module.py", root_path / "new.py"])
+            self.assertEqual(list(changed_paths), [])
+
+    @patch("handsdown.watcher.time")
+    def test_watch(self, time_mock):
+        time_mock.sleep.side_effect = [None, KeyboardInterrupt]
+        watcher = Watcher(MagicMock(), MagicMock())
+        watcher.check = MagicMock()
+        watcher.watch()
+        watcher.check.assert_called_once_with()
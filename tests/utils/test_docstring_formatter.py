@@ -1,7 +1,7 @@
 # pylint: disable=missing-docstring
 import unittest
 
-from handsdown.utils.docstring_formatter import DocstringFormatter
+from handsdown.utils.docstring_formatter import DocstringFormatter, format_docstring
 
 
 class TestDocstringFormatter(unittest.TestCase):
@@ -24,3 +24,8 @@ class TestDocstringFormatter(unittest.TestCase):
         self.assertEqual(
             DocstringFormatter(docstring).render(), "Wrong indent\n\nCorrect indent."
         )
+
+    def test_format_docstring(self):
+        docstring = "Summary\n\n    Description."
+        self.assertEqual(format_docstring(docstring), "Summary\n\nDescription.")
+        self.assertIs(format_docstring(docstring), format_docstring(docstring))
@@ -0,0 +1,88 @@
+# pylint: disable=missing-docstring
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from handsdown.utils.file_cache import FileCache, get_secret_key
+
+SECRET_KEY = b"0" * 32
+
+
+class TestFileCache(unittest.TestCase):
+    def test_get_key(self):
+        self.assertEqual(FileCache.get_key("a", "b"), FileCache.get_key("a", "b"))
+        self.assertNotEqual(FileCache.get_key("a", "b"), FileCache.get_key("ab"))
+        self.assertNotEqual(FileCache.get_key("a", "b"), FileCache.get_key("b", "a"))
+
+    def test_get_set(self):
+        with TemporaryDirectory() as temp_dir:
+            cache = FileCache(Path(temp_dir) / "cache", secret_key=SECRET_KEY)
+            key = cache.get_key("my_key")
+            self.assertIsNone(cache.get(key))
+
+            cache.set(key, {"name": [1, 2]})
+            self.assertEqual(cache.get(key), {"name": [1, 2]})
+
+            cache.set(key, lambda: None)
+            self.assertEqual(cache.get(key), {"name": [1, 2]})
+
+            (cache.path / f"{key}{cache.SUFFIX}").write_bytes(b"broken")
+            self.assertIsNone(cache.get(key))
+
+    def test_signature(self):
+        with TemporaryDirectory() as temp_dir:
+            cache = FileCache(Path(temp_dir) / "cache", secret_key=b"key" * 11)
+            cache.set("my_key", {"name": [1, 2]})
+            self.assertEqual(cache.get("my_key"), {"name": [1, 2]})
+
+            other_cache = FileCache(Path(temp_dir) / "cache", secret_key=b"other" * 7)
+            self.assertIsNone(other_cache.get("my_key"))
+
+            entry_path = cache.path / f"my_key{cache.SUFFIX}"
+            data = entry_path.read_bytes()
+            entry_path.write_bytes(data[:40] + bytes([data[40] ^ 1]) + data[41:])
+            self.assertIsNone(cache.get("my_key"))
+
+    def test_get_secret_key(self):
+        with TemporaryDirectory() as temp_dir:
+            key_path = Path(temp_dir) / "handsdown" / "cache.key"
+            key = get_secret_key(key_path)
+            self.assertEqual(len(key), 32)
+            self.assertEqual(get_secret_key(key_path), key)
+            self.assertEqual(key_path.stat().st_mode & 0o777, 0o600)
+
+            key_path.write_bytes(b"short")
+            key = get_secret_key(key_path)
+            self.assertEqual(len(key), 32)
+            self.assertEqual(key_path.read_bytes(), key)
+            self.assertEqual(key_path.stat().st_mode & 0o777, 0o600)
+            self.assertEqual(sorted(i.name for i in key_path.parent.iterdir()), ["cache.key"])
+
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": temp_dir, "HANDSDOWN_CACHE_KEY": ""}):
+                self.assertEqual(get_secret_key(), key)
+            with patch.dict(os.environ, {"HANDSDOWN_CACHE_KEY": "ci secret"}):
+                self.assertEqual(get_secret_key(), b"ci secret")
+                self.assertEqual(get_secret_key(key_path), key)
+
+    def test_cleanup(self):
+        with TemporaryDirectory() as temp_dir:
+            cache = FileCache(Path(temp_dir), max_size=2500, secret_key=SECRET_KEY)
+            for index, key in enumerate(("old", "used", "new")):
+                cache.set(key, b"0" * 1000)
+                entry_path = Path(temp_dir) / f"{key}{cache.SUFFIX}"
+                os.utime(entry_path, (index, index))
+
+            cache.cleanup()
+            self.assertEqual(cache.get("used"), b"0" * 1000)
+            self.assertEqual(cache.get("new"), b"0" * 1000)
+
+            cache.cleanup()
+            self.assertEqual(cache.get("used"), b"0" * 1000)
+
+            cache.max_size = 1500
+            os.utime(Path(temp_dir) / f"new{cache.SUFFIX}", (100, 100))
+            cache.cleanup()
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(sorted(i.name for i in Path(temp_dir).iterdir()), ["used.pickle"])
@@ -1,4 +1,5 @@
 # pylint: disable=missing-docstring
+import pickle
 import unittest
 
 from handsdown.utils.import_string import ImportString, ImportStringError
@@ -25,6 +26,22 @@ class TestImportString(unittest.TestCase):
         with self.assertRaises(ImportStringError):
             _ = ImportString("value").parent
 
+    def test_interned(self):
+        import_string = ImportString("parent.value")
+        self.assertIs(ImportString("parent.value"), import_string)
+        self.assertIs(ImportString("parent") + "value", import_string)
+        self.assertIs(pickle.loads(pickle.dumps(import_string)), import_string)
+        self.assertIs(import_string.parent, ImportString("parent"))
+        self.assertEqual(import_string.parts, ("parent", "value"))
+        with self.assertRaises(AttributeError):
+            import_string.value = "other"
+
+        ImportString.clear_cache()
+        new_import_string = ImportString("parent.value")
+        self.assertIsNot(new_import_string, import_string)
+        self.assertEqual(new_import_string, import_string)
+        self.assertEqual({import_string: 1}[new_import_string], 1)
+
     def test_is_top_level(self):
         self.assertTrue(ImportString("value").is_top_level())
         self.assertTrue(ImportString("").is_top_level())
@@ -11,6 +11,8 @@ class TestIndentTrimmer(unittest.TestCase):
         )
         self.assertEqual(IndentTrimmer.trim_empty_lines("\n  \n\n "), "")
         self.assertEqual(IndentTrimmer.trim_empty_lines("\n  \n  test \n "), "  test ")
+        self.assertEqual(IndentTrimmer.trim_empty_lines(""), "")
+        self.assertEqual(IndentTrimmer.trim_empty_lines("test\r\n\n"), "test\r")
 
     def test_trim_text(self):
         self.assertEqual(
@@ -37,6 +39,16 @@ class TestIndentTrimmer(unittest.TestCase):
             ["  asd", "asd", "   asd", ""],
         )
         self.assertEqual(IndentTrimmer.trim_lines([]), [])
+        self.assertEqual(IndentTrimmer.trim_lines(iter(["  asd", "   "])), ["asd", " "])
+
+    def test_trim_block(self):
+        self.assertEqual(
+            IndentTrimmer.trim_block(["", "  asd", " ", "   asd", " "]),
+            ["asd", "", " asd"],
+        )
+        self.assertEqual(IndentTrimmer.trim_block(["asd", "  asd", ""]), ["asd", "  asd"])
+        self.assertEqual(IndentTrimmer.trim_block([" ", ""]), [])
+        self.assertEqual(IndentTrimmer.trim_block([]), [])
 
     def test_get_line_indent(self):
         self.assertEqual(IndentTrimmer.get_line_indent("   test"), 3)
@@ -1,7 +1,9 @@
 # pylint: disable=missing-docstring
+import os
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from handsdown.utils.path_finder import PathFinder, PathFinderError
 
@@ -40,6 +42,13 @@ class TestPathFinder(unittest.TestCase):
         self.assertEqual(
             path_finder.relative(Path("/root/parent/source.py")), Path("source.py")
         )
+        self.assertEqual(path_finder.relative(Path("/root/parent")), Path())
+        self.assertEqual(path_finder.relative(Path("/root")), Path(".."))
+        self.assertEqual(PathFinder(Path("/")).relative(Path("/root")), Path("root"))
+        PathFinder.clear_cache()
+        self.assertEqual(
+            path_finder.relative(Path("/root/target.py")), Path("../target.py")
+        )
         with self.assertRaises(PathFinderError):
             path_finder.relative(Path("second/source.py"))
 
@@ -47,17 +56,25 @@ class TestPathFinder(unittest.TestCase):
     def test_include(self, PathMock):
         path = PathMock()
         path_finder = PathFinder(path)
-        self.assertEqual(path_finder.include_exprs, [])
+        self.assertEqual(path_finder.include_exprs, ())
         path_finder = path_finder.include("my_dir", "expr/**/*")
-        self.assertEqual(path_finder.include_exprs, ["my_dir/*", "expr/**/*"])
+        self.assertEqual(path_finder.include_exprs, ("my_dir/*", "expr/**/*"))
+        with self.assertRaises(AttributeError):
+            path_finder.include_exprs.append("other/*")  # type: ignore
 
     @patch("handsdown.utils.path_finder.Path")
     def test_exclude(self, PathMock):
         path = PathMock()
         path_finder = PathFinder(path)
-        self.assertEqual(path_finder.exclude_exprs, [])
+        self.assertEqual(path_finder.exclude_exprs, ())
         path_finder = path_finder.exclude("my_dir", "expr/**/*")
-        self.assertEqual(path_finder.exclude_exprs, ["my_dir/*", "expr/**/*"])
+        self.assertEqual(path_finder.exclude_exprs, ("my_dir/*", "expr/**/*"))
+        self.assertFalse(path_finder._match("my_dir/file.py"))
+        self.assertFalse(path_finder._match("expr/dir/file.py"))
+        self.assertTrue(path_finder._match("my_dir.py"))
+        self.assertTrue(path_finder._match_exclude_dir("my_dir"))
+        self.assertTrue(path_finder._match_exclude_dir("expr/dir"))
+        self.assertFalse(path_finder._match_exclude_dir("other"))
 
     @patch("handsdown.utils.path_finder.Path")
     def test_glob(self, PathMock):
@@ -77,6 +94,33 @@ class TestPathFinder(unittest.TestCase):
         path_finder.include_exprs = ["include/*"]
         self.assertEqual(list(path_finder.glob("glob_expr")), [include_file_mock])
 
+    def test_glob_walk(self):
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for path_str in (
+                "main.py",
+                "my_package/module.py",
+                "my_package/__pycache__/module.py",
+                "my_package/data.txt",
+                ".venv/lib/module.py",
+                "build/module.py",
+            ):
+                (root / path_str).parent.mkdir(parents=True, exist_ok=True)
+                (root / path_str).write_text("")
+
+            path_finder = PathFinder(root).exclude("build/*", "*/__pycache__/*", ".*/*")
+            with patch("handsdown.utils.path_finder.os.scandir", wraps=os.scandir) as scandir:
+                result = sorted(path_finder.glob("**/*.py"))
+            self.assertEqual(result, [root / "main.py", root / "my_package" / "module.py"])
+            self.assertEqual(scandir.call_count, 2)
+            self.assertEqual(
+                sorted(path_finder.include("my_package").glob("**/*.py")),
+                [root / "my_package" / "module.py"],
+            )
+            self.assertEqual(
+                sorted(path_finder.exclude("*/module.py").glob("**/*.py")), [root / "main.py"]
+            )
+
     @patch("handsdown.utils.path_finder.Path")
     def test_mkdir(self, _PathMock):
         path = MagicMock()
@@ -0,0 +1,60 @@
+# pylint: disable=missing-docstring
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from handsdown.utils.profiler import Profiler, ProfileRecord
+
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled(self):
+        profiler = Profiler()
+        with profiler.stage("render", "my_module"):
+            pass
+        self.assertEqual(profiler.records, [])
+        self.assertIs(profiler.stage("load"), profiler.stage("render"))
+
+    def test_stage(self):
+        profiler = Profiler(enabled=True)
+        with profiler.stage("render", "my_module"):
+            with profiler.stage("links", "my_module"):
+                pass
+
+        with self.assertRaises(ValueError):
+            with profiler.stage("render", "other"):
+                raise ValueError("test")
+
+        self.assertEqual(
+            [(i.stage, i.module, i.depth) for i in profiler.records],
+            [("links", "my_module", 1), ("render", "my_module", 0), ("render", "other", 0)],
+        )
+        self.assertEqual(profiler.get_stages()["render"]["count"], 2)
+
+    def test_records(self):
+        profiler = Profiler(enabled=True)
+        profiler.add_records(
+            [
+                ProfileRecord("load", "a", 1.0, 0.5, 0),
+                ProfileRecord("render", "a", 2.0, 2.0, 0),
+                ProfileRecord("links", "a", 1.5, 1.5, 1),
+                ProfileRecord("render", "b", 4.0, 4.0, 0),
+                ProfileRecord("index", "", 1.0, 1.0, 0),
+            ]
+        )
+        self.assertEqual(profiler.get_stages()["render"], dict(wall=6.0, cpu=6.0, count=2))
+        self.assertEqual(
+            profiler.get_modules()["a"], dict(total=3.0, load=1.0, render=2.0, links=1.5)
+        )
+        self.assertEqual(profiler.get_slowest_modules(), [("b", 4.0), ("a", 3.0)])
+        self.assertEqual(profiler.get_slowest_modules(1), [("b", 4.0)])
+
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "profile.json"
+            profiler.write(path)
+            report = json.loads(path.read_text())
+
+        self.assertEqual(report["slowest_modules"][0], dict(module="b", wall=4.0))
+        self.assertEqual(report["stages"]["index"]["count"], 1)
+        self.assertEqual(len(profiler.pop_records()), 5)
+        self.assertEqual(profiler.records, [])